@@ -0,0 +1,163 @@
+"""
+Copyright (c) 2026 ZuInnoTe (Jörn Franke) <oss@zuinnote.eu>
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+"""
+Benchmark of the Parquet exporter throughput (items/sec) for different batch sizes.
+
+It compares the column buffer of the ParquetItemExporter ("after") with the previous
+approach of concatenating a one-row pandas DataFrame per item ("before").
+
+Run from the root of the repository:
+
+  python -m benchmarks.benchmark_parquet
+
+The "before" approach is quadratic in the batch size. Thus, it is stopped after
+--max-seconds and the throughput up to that point is reported (marked with *).
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import pandas as pd
+import pyarrow
+
+from zuinnote.scrapy.contrib.bigexporters import ParquetItemExporter
+
+
+class _TimeLimitExceeded(Exception):
+    pass
+
+
+class PandasBuffer:
+    """
+    Buffer using the previous per item pd.concat approach
+    """
+
+    def __init__(self, columns):
+        self.columns = columns
+        self.reset()
+
+    def reset(self):
+        self.df = pd.DataFrame(columns=self.columns)
+
+    def append(self, fields):
+        row = {column: fields.get(column, None) for column in self.columns}
+        self.df = pd.concat(
+            [self.df if not self.df.empty else None, pd.DataFrame.from_dict([row])]
+        )
+
+    def to_record_batches(self):
+        return pyarrow.Table.from_pandas(self.df).combine_chunks().to_batches()
+
+
+class LegacyParquetItemExporter(ParquetItemExporter):
+    """
+    Parquet exporter using the previous per item pd.concat approach
+    """
+
+    def _init_table(self, item):
+        self._get_columns(item)
+        self.batch = PandasBuffer(self.columns)
+
+    def _append_item(self, item):
+        fields = dict(
+            self._get_serialized_fields(item, default_value="", include_empty=True)
+        )
+        self.batch.append(fields)
+
+
+def _get_item(i):
+    return {
+        "url": f"https://quotes.toscrape.com/page/{i}/",
+        "text": "The world as we have created it is a process of our thinking.",
+        "author": "Albert Einstein",
+        "tags": ["change", "deep-thoughts", "thinking", "world"],
+        "rating": 4.5,
+        "position": i,
+        "visited": True,
+    }
+
+
+def run(exporter_class, batch_size, no_items, max_seconds):
+    """
+    Exports no_items items and returns (items/sec, number of items exported, finished)
+    """
+    fd, filename = tempfile.mkstemp(suffix=".parquet")
+    os.close(fd)
+    exported = 0
+    finished = True
+    try:
+        with open(filename, "wb") as f:
+            exporter = exporter_class(
+                file=f, no_items_batch=batch_size, compression="zstd"
+            )
+            exporter.start_exporting()
+            start = time.perf_counter()
+            try:
+                for i in range(no_items):
+                    exporter.export_item(_get_item(i))
+                    exported += 1
+                    if (
+                        exported % 1000 == 0
+                        and time.perf_counter() - start > max_seconds
+                    ):
+                        raise _TimeLimitExceeded()
+                exporter.finish_exporting()
+            except _TimeLimitExceeded:
+                finished = False
+            duration = time.perf_counter() - start
+    finally:
+        os.remove(filename)
+    return exported / duration, exported, finished
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--batch-sizes", type=int, nargs="+", default=[1000, 10000, 100000]
+    )
+    parser.add_argument(
+        "--batches",
+        type=int,
+        default=2,
+        help="number of batches to export per batch size",
+    )
+    parser.add_argument("--max-seconds", type=float, default=60.0)
+    args = parser.parse_args()
+    print(f"{'batch size':>12} {'before (items/s)':>20} {'after (items/s)':>20}")
+    for batch_size in args.batch_sizes:
+        no_items = batch_size * args.batches
+        before, _, before_finished = run(
+            LegacyParquetItemExporter, batch_size, no_items, args.max_seconds
+        )
+        after, _, after_finished = run(
+            ParquetItemExporter, batch_size, no_items, args.max_seconds
+        )
+        before_str = f"{before:,.0f}{'' if before_finished else '*'}"
+        after_str = f"{after:,.0f}{'' if after_finished else '*'}"
+        print(f"{batch_size:>12,} {before_str:>20} {after_str:>20}")
+
+
+if __name__ == "__main__":
+    main()
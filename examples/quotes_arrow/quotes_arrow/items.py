@@ -0,0 +1,15 @@
+# Define here the models for your scraped items
+#
+# See documentation in:
+# https://docs.scrapy.org/en/latest/topics/items.html
+
+import scrapy
+from itemloaders.processors import Join
+
+
+class QuotesArrowItem(scrapy.Item):
+    # define the fields for your item here like:
+    # name = scrapy.Field()
+    text = scrapy.Field(output_processor=Join())
+    author = scrapy.Field()
+    tags = scrapy.Field()
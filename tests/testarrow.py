@@ -0,0 +1,210 @@
+"""
+Copyright (c) 2026 ZuInnoTe (Jörn Franke) <oss@zuinnote.eu>
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import unittest
+import tempfile
+import datetime
+from datetime import timezone
+import os
+
+import pyarrow
+import pyarrow.ipc
+
+from scrapy.loader import ItemLoader
+from zuinnote.scrapy.contrib.bigexporters import ArrowIpcItemExporter
+from .testitem import TestItem, TestTypedItem
+
+
+class TestArrowIpcItemExporter(unittest.TestCase):
+    def setUp(self):
+        # open file
+        fd, filename = tempfile.mkstemp()
+        self.filename = filename
+        self.fd = fd
+        self.file = open(filename, "wb")
+
+    def tearDown(self):
+        # close file
+        self.file.close()
+
+        os.close(self.fd)
+        if os.path.exists(self.filename):
+            os.remove(self.filename)
+
+    def test_arrow_export_type_schema_stream(self):
+        """
+        Test if a stream is correctly written with native Python data types
+        """
+        # create exporter
+        itemExporter = ArrowIpcItemExporter(
+            file=self.file,
+            no_items_batch=3,
+            convertallstrings=False,
+            format="stream",
+            compression="lz4",
+        )
+        self.export_type_schema(itemExporter)
+        with pyarrow.ipc.open_stream(self.filename) as reader:
+            table = reader.read_all()
+        self.check_type_schema(table)
+
+    def test_arrow_export_type_schema_file(self):
+        """
+        Test if a file is correctly written with native Python data types
+        """
+        # create exporter
+        itemExporter = ArrowIpcItemExporter(
+            file=self.file,
+            no_items_batch=3,
+            schema_inference_items=1,
+            convertallstrings=False,
+            format="file",
+            compression="zstd",
+            compression_level=3,
+        )
+        self.export_type_schema(itemExporter)
+        with pyarrow.ipc.open_file(self.filename) as reader:
+            self.assertEqual(
+                3, reader.num_record_batches, msg="One record batch per batch"
+            )
+            table = reader.read_all()
+        self.check_type_schema(table)
+
+    def test_arrow_export_dictionary_columns(self):
+        """
+        Test if dictionary encoded columns are written with different dictionaries per record batch
+        """
+        for ipc_format, arrow_type in [
+            ("stream", pyarrow.dictionary(pyarrow.int32(), pyarrow.string())),
+            ("file", pyarrow.string()),
+        ]:
+            with open(self.filename, "wb") as f:
+                itemExporter = ArrowIpcItemExporter(
+                    file=f, no_items_batch=3, format=ipc_format
+                )
+                itemExporter.start_exporting()
+                for i in range(10):
+                    l = ItemLoader(TestTypedItem())
+                    l.add_value("ftext", f"text {i // 4}")
+                    l.add_value("fint", i)
+                    itemExporter.export_item(l.load_item())
+                itemExporter.finish_exporting()
+            if ipc_format == "stream":
+                table = pyarrow.ipc.open_stream(self.filename).read_all()
+            else:
+                table = pyarrow.ipc.open_file(self.filename).read_all()
+            self.assertEqual(
+                arrow_type,
+                table.schema.field("ftext").type,
+                msg=f"Type of dictionary encoded column in {ipc_format} format",
+            )
+            self.assertEqual(
+                [f"text {i // 4}" for i in range(10)],
+                table.column("ftext").to_pylist(),
+                msg="Dictionary encoded data is read correctly",
+            )
+
+    def test_arrow_export_stream_while_exporting(self):
+        """
+        Test if the written record batches of a stream can be read before the export finishes
+        """
+        # create exporter
+        itemExporter = ArrowIpcItemExporter(
+            file=self.file, no_items_batch=3, schema_inference_items=1
+        )
+        itemExporter.start_exporting()
+        for i in range(5):
+            itemExporter.export_item({"fint": i})
+        with open(self.filename, "rb") as f:
+            reader = pyarrow.ipc.open_stream(f)
+            self.assertEqual(
+                [0, 1, 2, 3],
+                reader.read_next_batch().column(0).to_pylist(),
+                msg="First record batch is read during the export",
+            )
+        itemExporter.finish_exporting()
+
+    def test_arrow_export_invalid_format(self):
+        """
+        Test if an unknown format raises an error
+        """
+        with self.assertRaises(RuntimeError):
+            ArrowIpcItemExporter(file=self.file, format="parquet")
+
+    def export_type_schema(self, itemExporter):
+        itemExporter.start_exporting()
+        # create and write some test data
+        num_records = 10
+        for i in range(num_records):
+            l = ItemLoader(TestItem())
+            l.add_value("ftext", "this is a test text")
+            l.add_value("ftext_array", ["test1", "test2", "test3", "test4"])
+            l.add_value("ffloat", float(2.5))
+            l.add_value("fint", int(i))
+            l.add_value("fbool", False)
+            datetime_str = "2020-02-29T11:12:13"
+            datetime_fmt = "%Y-%m-%dT%H:%M:%S"
+            datetime_obj = datetime.datetime.strptime(datetime_str, datetime_fmt)
+            datetime_obj = datetime_obj.replace(tzinfo=timezone.utc)
+            l.add_value("fdatetime", datetime_obj)
+            itemExporter.export_item(l.load_item())
+        itemExporter.finish_exporting()
+        self.file.close()
+
+    def check_type_schema(self, table):
+        self.assertEqual(
+            ["this is a test text"] * 10,
+            table.column("ftext").to_pylist(),
+            msg="String data is read correctly",
+        )
+        self.assertEqual(
+            [["test1", "test2", "test3", "test4"]] * 10,
+            table.column("ftext_array").to_pylist(),
+            msg="String array data is read correctly",
+        )
+        self.assertEqual(
+            [2.5] * 10,
+            table.column("ffloat").to_pylist(),
+            msg="Float data is read correctly",
+        )
+        self.assertEqual(
+            list(range(10)),
+            table.column("fint").to_pylist(),
+            msg="Int data is read correctly",
+        )
+        self.assertEqual(
+            [False] * 10,
+            table.column("fbool").to_pylist(),
+            msg="Bool data is read correctly",
+        )
+        self.assertEqual(
+            ["2020-02-29T11:12:13"] * 10,
+            [
+                value.strftime("%Y-%m-%dT%H:%M:%S")
+                for value in table.column("fdatetime").to_pylist()
+            ],
+            msg="DateTime data is read correctly",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -21,6 +21,7 @@ SOFTWARE.
 """
 
 import unittest
+import unittest.mock
 import tempfile
 import datetime
 import os
@@ -28,7 +29,7 @@ import os
 import scrapy
 import fastavro
 from scrapy.loader import ItemLoader
-from zuinnote.scrapy.contrib.bigexporters import AvroItemExporter
+from zuinnote.scrapy.contrib.bigexporters import AvroItemExporter, AVRO_SCHEMA_CACHE
 from .testitem import TestItem
 
 
@@ -124,6 +125,304 @@ class TestAvroItemExporter(unittest.TestCase):
         )
         self.export_type_schema(itemExporter)
 
+    def test_avro_export_type_schema_blocks(self):
+        """
+        Tests if blocks are written based on the sync interval and not on the record cache
+        """
+        # create exporter
+        itemExporter = AvroItemExporter(
+            file=self.file,
+            compression="deflate",
+            compressionlevel=None,
+            metadata=None,
+            syncinterval=16000,
+            recordcache=3,
+            syncmarker=None,
+            convertallstrings=False,
+            validator=None,
+            avroschema={
+                "doc": "test doc",
+                "name": "test",
+                "type": "record",
+                "fields": [
+                    {"name": "ftext", "type": "string"},
+                    {
+                        "name": "ftext_array",
+                        "type": {"type": "array", "items": "string", "default": []},
+                    },
+                    {"name": "ffloat", "type": "float"},
+                    {"name": "fint", "type": "int"},
+                    {"name": "fbool", "type": "boolean"},
+                    {
+                        "name": "fdatetime",
+                        "type": "long",
+                        "logicalType": "timestamp-millis",
+                    },
+                ],
+            },
+        )
+        self.export_type_schema(itemExporter)
+        with open(self.filename, "rb") as f:
+            self.assertEqual(
+                1,
+                len(list(fastavro.block_reader(f))),
+                msg="All records are written in one block",
+            )
+
+    def test_avro_export_type_schema_max_buffer_bytes(self):
+        """
+        Tests if the record cache is written before the export finishes if it exceeds the memory budget
+        """
+        # create exporter
+        itemExporter = AvroItemExporter(
+            file=self.file,
+            compression="deflate",
+            compressionlevel=None,
+            metadata=None,
+            # write a block for every record handed to the writer
+            syncinterval=1,
+            recordcache=10000,
+            max_buffer_bytes=300,
+            syncmarker=None,
+            convertallstrings=False,
+            validator=None,
+            avroschema={
+                "doc": "test doc",
+                "name": "test",
+                "type": "record",
+                "fields": [
+                    {"name": "ftext", "type": "string"},
+                    {
+                        "name": "ftext_array",
+                        "type": {"type": "array", "items": "string", "default": []},
+                    },
+                    {"name": "ffloat", "type": "float"},
+                    {"name": "fint", "type": "int"},
+                    {"name": "fbool", "type": "boolean"},
+                    {
+                        "name": "fdatetime",
+                        "type": "long",
+                        "logicalType": "timestamp-millis",
+                    },
+                ],
+            },
+        )
+        itemExporter.start_exporting()
+        num_records = 10
+        for i in range(num_records):
+            l = ItemLoader(TestItem())
+            l.add_value("ftext", "this is a test text")
+            l.add_value("ftext_array", ["test1", "test2", "test3", "test4"])
+            l.add_value("ffloat", float(2.5))
+            l.add_value("fint", int(i))
+            l.add_value("fbool", False)
+            l.add_value("fdatetime", 1582974733)
+            itemExporter.export_item(l.load_item())
+        self.file.flush()
+        self.assertGreater(
+            os.path.getsize(self.filename),
+            0,
+            msg="Records are written before the export finishes",
+        )
+        self.assertLess(
+            len(itemExporter.records),
+            num_records,
+            msg="Record cache is flushed if it exceeds the memory budget",
+        )
+        itemExporter.finish_exporting()
+        with open(self.filename, "rb") as f:
+            self.assertEqual(
+                list(range(num_records)),
+                [record["fint"] for record in fastavro.reader(f)],
+                msg="All records are written",
+            )
+
+    def test_avro_export_type_schema_streaming(self):
+        """
+        Tests if all records are written if they are encoded directly into blocks
+        """
+        # create exporter
+        itemExporter = AvroItemExporter(
+            file=self.file,
+            compression="deflate",
+            compressionlevel=None,
+            metadata=None,
+            syncinterval=100,
+            recordcache=10000,
+            streaming=True,
+            syncmarker=None,
+            convertallstrings=False,
+            validator=None,
+            avroschema={
+                "doc": "test doc",
+                "name": "test",
+                "type": "record",
+                "fields": [
+                    {"name": "ftext", "type": "string"},
+                    {
+                        "name": "ftext_array",
+                        "type": {"type": "array", "items": "string", "default": []},
+                    },
+                    {"name": "ffloat", "type": "float"},
+                    {"name": "fint", "type": "int"},
+                    {"name": "fbool", "type": "boolean"},
+                    {
+                        "name": "fdatetime",
+                        "type": "long",
+                        "logicalType": "timestamp-millis",
+                    },
+                ],
+            },
+        )
+        self.export_type_schema(itemExporter)
+
+    def test_avro_export_type_schema_compressionthreads(self):
+        """
+        Tests if all records are written if blocks are compressed in parallel
+        """
+        # create exporter
+        itemExporter = AvroItemExporter(
+            file=self.file,
+            compression="deflate",
+            compressionlevel=None,
+            metadata=None,
+            syncinterval=100,
+            recordcache=3,
+            compressionthreads=2,
+            syncmarker=None,
+            convertallstrings=False,
+            validator=None,
+            avroschema={
+                "doc": "test doc",
+                "name": "test",
+                "type": "record",
+                "fields": [
+                    {"name": "ftext", "type": "string"},
+                    {
+                        "name": "ftext_array",
+                        "type": {"type": "array", "items": "string", "default": []},
+                    },
+                    {"name": "ffloat", "type": "float"},
+                    {"name": "fint", "type": "int"},
+                    {"name": "fbool", "type": "boolean"},
+                    {
+                        "name": "fdatetime",
+                        "type": "long",
+                        "logicalType": "timestamp-millis",
+                    },
+                ],
+            },
+        )
+        self.export_type_schema(itemExporter)
+
+    def test_avro_export_compressionthreads_fallback(self):
+        """
+        Tests if records are written by the fastavro writer if blocks cannot be compressed in parallel
+        """
+        # create exporter
+        itemExporter = AvroItemExporter(
+            file=self.file,
+            compression="deflate",
+            compressionlevel=None,
+            metadata=None,
+            syncinterval=100,
+            recordcache=3,
+            compressionthreads=2,
+            syncmarker=None,
+            convertallstrings=False,
+            validator=None,
+            avroschema={
+                "name": "test",
+                "type": "record",
+                "fields": [{"name": "fint", "type": "int"}],
+            },
+        )
+        with unittest.mock.patch(
+            "zuinnote.scrapy.contrib._avroblocks.BLOCK_WRITERS", None
+        ):
+            itemExporter.start_exporting()
+            for i in range(10):
+                itemExporter.export_item({"fint": i})
+            itemExporter.finish_exporting()
+        self.assertIsInstance(
+            itemExporter.avro_writer,
+            fastavro.write.Writer,
+            msg="fastavro writer is used",
+        )
+        self.file.close()
+        with open(self.filename, "rb") as f:
+            records = [record["fint"] for record in fastavro.reader(f)]
+        self.assertEqual(list(range(10)), records, msg="All records are written")
+
+    def test_avro_export_string_schema(self):
+        """
+        Test if all values are converted to strings
+        """
+        # create exporter
+        itemExporter = AvroItemExporter(
+            file=self.file,
+            compression="deflate",
+            compressionlevel=None,
+            metadata=None,
+            syncinterval=16000,
+            recordcache=10000,
+            syncmarker=None,
+            convertallstrings=True,
+            validator=None,
+            avroschema={
+                "name": "test",
+                "type": "record",
+                "fields": [
+                    {"name": "ffloat", "type": "string"},
+                    {"name": "fint", "type": "string"},
+                    {"name": "fbool", "type": "string"},
+                ],
+            },
+        )
+        itemExporter.start_exporting()
+        for i in range(10):
+            itemExporter.export_item(
+                {"ffloat": float(i), "fint": i, "fbool": i % 2 == 0}
+            )
+        itemExporter.finish_exporting()
+        self.file.close()
+        with open(self.filename, "rb") as f:
+            records = list(fastavro.reader(f))
+        self.assertEqual(
+            [
+                {"ffloat": str(float(i)), "fint": str(i), "fbool": str(i % 2 == 0)}
+                for i in range(10)
+            ],
+            records,
+            msg="Values are converted to strings",
+        )
+
+    def test_avro_schema_cache(self):
+        """
+        Tests if parsed schemas are shared independent of the order of their keys
+        """
+        AVRO_SCHEMA_CACHE.clear()
+        schema = {
+            "name": "test",
+            "type": "record",
+            "fields": [{"name": "ftext", "type": "string"}],
+        }
+        reordered_schema = {
+            "fields": [{"type": "string", "name": "ftext"}],
+            "type": "record",
+            "name": "test",
+        }
+        parsed_schema = AVRO_SCHEMA_CACHE.get(schema)
+        self.assertIs(
+            parsed_schema,
+            AVRO_SCHEMA_CACHE.get(reordered_schema),
+            msg="Parsed schema is reused",
+        )
+        info = AVRO_SCHEMA_CACHE.info()
+        self.assertEqual(1, info["misses"], msg="Schema is parsed once")
+        self.assertEqual(1, info["hits"], msg="Schema is found in cache")
+        self.assertEqual(1, info["size"], msg="Schema is stored once")
+
     def export_type_schema(self, itemExporter):
         itemExporter.start_exporting()
         # create and write some test data
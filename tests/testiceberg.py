@@ -22,6 +22,7 @@ SOFTWARE.
 
 import unittest
 import tempfile
+import io
 import datetime
 import json
 import os
@@ -31,7 +32,11 @@ import scrapy
 from pyiceberg.catalog import load_catalog
 import numpy as np
 from scrapy.loader import ItemLoader
-from zuinnote.scrapy.contrib.bigexporters import IcebergItemExporter
+from zuinnote.scrapy.contrib.bigexporters import (
+    IcebergItemExporter,
+    ICEBERG_CATALOG_CACHE,
+    compact_iceberg_table,
+)
 from .testitem import TestItem
 
 
@@ -138,6 +143,365 @@ class TestIcebergItemExporter(unittest.TestCase):
         )
         self.export_type_schema(itemExporter)
 
+    def test_iceberg_export_type_schema_commit_batches(self):
+        """
+        Tests if all batches are committed in one snapshot
+        """
+        # create exporter
+        itemExporter = IcebergItemExporter(
+            file=self.file,
+            no_items_batch=3,
+            commit_batches=10,
+            convertallstrings=False,
+            iceberg_catalog=self.test_catalog_configuration,
+            iceberg_namespace={
+                "name": "mynamespace",
+                "create_if_not_exists": True,
+                "properties": {},
+            },
+            iceberg_table={
+                "name": f"{self.test_table_name}",
+                "create_if_not_exists": True,
+                "properties": {},
+            },
+        )
+        self.export_type_schema(itemExporter)
+        test_catalog_data = next(iter(self.test_catalog_configuration.items()))
+        test_result_catalog = load_catalog(test_catalog_data[0], **test_catalog_data[1])
+        test_result_table = test_result_catalog.load_table(self.test_table_name)
+        self.assertEqual(
+            1,
+            len(test_result_table.snapshots()),
+            msg="All batches are committed in one snapshot",
+        )
+        self.assertEqual(
+            "10",
+            test_result_table.current_snapshot().summary["added-records"],
+            msg="All records are committed in one snapshot",
+        )
+
+    def test_iceberg_export_type_schema_commit_interval(self):
+        """
+        Tests if batches are committed only based on time if only commit_interval is specified
+        """
+        # create exporter
+        itemExporter = IcebergItemExporter(
+            file=self.file,
+            no_items_batch=3,
+            commit_interval=3600,
+            convertallstrings=False,
+            iceberg_catalog=self.test_catalog_configuration,
+            iceberg_namespace={
+                "name": "mynamespace",
+                "create_if_not_exists": True,
+                "properties": {},
+            },
+            iceberg_table={
+                "name": f"{self.test_table_name}",
+                "create_if_not_exists": True,
+                "properties": {},
+            },
+        )
+        self.export_type_schema(itemExporter)
+        test_catalog_data = next(iter(self.test_catalog_configuration.items()))
+        test_result_catalog = load_catalog(test_catalog_data[0], **test_catalog_data[1])
+        test_result_table = test_result_catalog.load_table(self.test_table_name)
+        self.assertEqual(
+            1,
+            len(test_result_table.snapshots()),
+            msg="All batches are committed in one snapshot when finishing",
+        )
+        self.assertEqual(
+            "10",
+            test_result_table.current_snapshot().summary["added-records"],
+            msg="All records are committed in one snapshot",
+        )
+
+    def test_iceberg_export_type_schema_add_files(self):
+        """
+        Tests if Parquet data files are written and added in one snapshot
+        """
+        # create exporter
+        itemExporter = IcebergItemExporter(
+            file=self.file,
+            no_items_batch=3,
+            schema_inference_items=1,
+            write_mode="add_files",
+            parquet_options={"compression": "zstd", "compression_level": 3},
+            target_file_size_bytes=1,
+            convertallstrings=False,
+            iceberg_catalog=self.test_catalog_configuration,
+            iceberg_namespace={
+                "name": "mynamespace",
+                "create_if_not_exists": True,
+                "properties": {},
+            },
+            iceberg_table={
+                "name": f"{self.test_table_name}",
+                "create_if_not_exists": True,
+                "properties": {},
+            },
+        )
+        self.export_type_schema(itemExporter)
+        test_catalog_data = next(iter(self.test_catalog_configuration.items()))
+        test_result_catalog = load_catalog(test_catalog_data[0], **test_catalog_data[1])
+        test_result_table = test_result_catalog.load_table(self.test_table_name)
+        self.assertEqual(
+            1,
+            len(test_result_table.snapshots()),
+            msg="All data files are added in one snapshot",
+        )
+        self.assertEqual(
+            "3",
+            test_result_table.current_snapshot().summary["added-data-files"],
+            msg="One data file is written per batch if the target file size is reached",
+        )
+
+    def test_iceberg_export_type_schema_compact(self):
+        """
+        Tests if the data files of all batches are compacted when finishing
+        """
+        # create exporter
+        itemExporter = IcebergItemExporter(
+            file=self.file,
+            no_items_batch=3,
+            compact=True,
+            compact_expire_snapshots=True,
+            convertallstrings=False,
+            iceberg_catalog=self.test_catalog_configuration,
+            iceberg_namespace={
+                "name": "mynamespace",
+                "create_if_not_exists": True,
+                "properties": {},
+            },
+            iceberg_table={
+                "name": f"{self.test_table_name}",
+                "create_if_not_exists": True,
+                "properties": {},
+            },
+        )
+        self.export_type_schema(itemExporter)
+        test_catalog_data = next(iter(self.test_catalog_configuration.items()))
+        test_result_catalog = load_catalog(test_catalog_data[0], **test_catalog_data[1])
+        test_result_table = test_result_catalog.load_table(self.test_table_name)
+        self.assertEqual(
+            1,
+            len(test_result_table.inspect.files()),
+            msg="Data files are compacted into one data file",
+        )
+        self.assertEqual(
+            1,
+            len(test_result_table.snapshots()),
+            msg="Snapshots of the batches are expired",
+        )
+
+    def test_iceberg_compact_target_file_size(self):
+        """
+        Tests if the data files are compacted in groups of the target file size
+        """
+        # create exporter
+        itemExporter = IcebergItemExporter(
+            file=self.file,
+            no_items_batch=3,
+            schema_inference_items=1,
+            commit_batches=10,
+            convertallstrings=False,
+            iceberg_catalog=self.test_catalog_configuration,
+            iceberg_namespace={
+                "name": "mynamespace",
+                "create_if_not_exists": True,
+                "properties": {},
+            },
+            iceberg_table={
+                "name": f"{self.test_table_name}",
+                "create_if_not_exists": True,
+                "properties": {},
+            },
+        )
+        self.export_type_schema(itemExporter)
+        test_catalog_data = next(iter(self.test_catalog_configuration.items()))
+        test_result_catalog = load_catalog(test_catalog_data[0], **test_catalog_data[1])
+        test_result_table = test_result_catalog.load_table(self.test_table_name)
+        file_sizes = test_result_table.inspect.files().column("file_size_in_bytes")
+        self.assertEqual(3, len(file_sizes), msg="One data file is written per batch")
+        # only two of the three data files fit into one compacted data file
+        self.assertEqual(
+            2,
+            compact_iceberg_table(
+                test_result_table,
+                target_file_size_bytes=2 * max(file_sizes.to_pylist()),
+            ),
+            msg="Data files of the first group are rewritten",
+        )
+        self.assertEqual(
+            2,
+            len(test_result_table.inspect.files()),
+            msg="Data files are compacted in groups of the target file size",
+        )
+        self.assertEqual(
+            10,
+            len(test_result_table.scan().to_arrow()),
+            msg="All records are kept",
+        )
+
+    def test_iceberg_export_type_schema_partition_spec(self):
+        """
+        Tests if the table is created with the partition spec
+        """
+        # create exporter
+        itemExporter = IcebergItemExporter(
+            file=self.file,
+            no_items_batch=3,
+            convertallstrings=False,
+            iceberg_catalog=self.test_catalog_configuration,
+            iceberg_namespace={
+                "name": "mynamespace",
+                "create_if_not_exists": True,
+                "properties": {},
+            },
+            iceberg_table={
+                "name": f"{self.test_table_name}",
+                "create_if_not_exists": True,
+                "properties": {},
+                "partition_spec": ["identity(fbool)", "bucket(4, fint)"],
+            },
+        )
+        self.export_type_schema(itemExporter)
+        test_catalog_data = next(iter(self.test_catalog_configuration.items()))
+        test_result_catalog = load_catalog(test_catalog_data[0], **test_catalog_data[1])
+        test_result_table = test_result_catalog.load_table(self.test_table_name)
+        self.assertEqual(
+            ["identity", "bucket[4]"],
+            [str(field.transform) for field in test_result_table.spec().fields],
+            msg="Table is created with the partition spec",
+        )
+
+    def test_iceberg_export_invalid_partition_spec(self):
+        """
+        Tests if an invalid partition spec is rejected
+        """
+        with self.assertRaises(RuntimeError):
+            IcebergItemExporter(
+                file=self.file,
+                iceberg_catalog=self.test_catalog_configuration,
+                iceberg_namespace={"name": "mynamespace"},
+                iceberg_table={
+                    "name": f"{self.test_table_name}",
+                    "partition_spec": ["bucket(fint, 4)"],
+                },
+            )
+
+    def test_iceberg_export_catalog_cache(self):
+        """
+        Tests if catalog and table are shared by exporters and if the table is refreshed after a concurrent commit
+        """
+        ICEBERG_CATALOG_CACHE.clear()
+        exporters = []
+        for i in range(2):
+            itemExporter = IcebergItemExporter(
+                file=self.file,
+                no_items_batch=10000,
+                convertallstrings=False,
+                iceberg_catalog=self.test_catalog_configuration,
+                iceberg_namespace={
+                    "name": "mynamespace",
+                    "create_if_not_exists": True,
+                    "properties": {},
+                },
+                iceberg_table={
+                    "name": f"{self.test_table_name}",
+                    "create_if_not_exists": True,
+                    # disable retries of newer pyiceberg versions to test the retries of the exporter
+                    "properties": {"commit.retry.num-retries": "0"},
+                },
+            )
+            itemExporter.start_exporting()
+            for j in range(5):
+                l = ItemLoader(TestItem())
+                l.add_value("ftext", "this is a test text")
+                l.add_value("fint", int(10))
+                itemExporter.export_item(l.load_item())
+            # flush without closing the file
+            itemExporter._flush_table()
+            exporters.append(itemExporter)
+            if i == 0:
+                # concurrent commit by another writer
+                test_catalog_data = next(iter(self.test_catalog_configuration.items()))
+                other_catalog = load_catalog(
+                    test_catalog_data[0], **test_catalog_data[1]
+                )
+                other_table = other_catalog.load_table(self.test_table_name)
+                other_table.append(other_table.scan().to_arrow())
+        self.assertIs(
+            exporters[0].pyiceberg_catalog,
+            exporters[1].pyiceberg_catalog,
+            msg="Catalog is shared",
+        )
+        self.assertIs(
+            exporters[0].pyiceberg_table,
+            exporters[1].pyiceberg_table,
+            msg="Table is shared",
+        )
+        test_catalog_data = next(iter(self.test_catalog_configuration.items()))
+        test_result_catalog = load_catalog(test_catalog_data[0], **test_catalog_data[1])
+        test_result_table = test_result_catalog.load_table(self.test_table_name)
+        self.assertEqual(
+            15,
+            len(test_result_table.scan().to_arrow()),
+            msg="All records are committed after a concurrent commit",
+        )
+
+    def test_iceberg_export_catalog_cache_dropped_table(self):
+        """
+        Tests if a cached table is reloaded if it has been dropped by another process
+        """
+        ICEBERG_CATALOG_CACHE.clear()
+        test_catalog_data = next(iter(self.test_catalog_configuration.items()))
+        for i in range(2):
+            itemExporter = IcebergItemExporter(
+                file=io.BytesIO(),
+                no_items_batch=10000,
+                convertallstrings=False,
+                iceberg_catalog=self.test_catalog_configuration,
+                iceberg_namespace={
+                    "name": "mynamespace",
+                    "create_if_not_exists": True,
+                    "properties": {},
+                },
+                iceberg_table={
+                    "name": f"{self.test_table_name}",
+                    "create_if_not_exists": True,
+                    "properties": {},
+                },
+            )
+            itemExporter.start_exporting()
+            for j in range(5):
+                l = ItemLoader(TestItem())
+                l.add_value("ftext", "this is a test text")
+                l.add_value("fint", int(i))
+                itemExporter.export_item(l.load_item())
+            itemExporter.finish_exporting()
+            if i == 0:
+                # table is dropped by another process
+                other_catalog = load_catalog(
+                    test_catalog_data[0], **test_catalog_data[1]
+                )
+                other_catalog.drop_table(self.test_table_name)
+        test_result_catalog = load_catalog(test_catalog_data[0], **test_catalog_data[1])
+        test_result_table = test_result_catalog.load_table(self.test_table_name)
+        self.assertEqual(
+            [1] * 5,
+            test_result_table.scan().to_arrow().column("fint").to_pylist(),
+            msg="Table is recreated and records are committed",
+        )
+        self.assertIs(
+            itemExporter.pyiceberg_table,
+            ICEBERG_CATALOG_CACHE.get_table(
+                itemExporter.iceberg_catalog_configuration, self.test_table_name
+            ),
+            msg="Reloaded table is cached",
+        )
+
     def export_type_schema(self, itemExporter):
         itemExporter.start_exporting()
         # create and write some test data
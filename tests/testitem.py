@@ -33,3 +33,18 @@ class TestItem(scrapy.Item):
     fint = scrapy.Field(output_processor=TakeFirst())
     fbool = scrapy.Field(output_processor=TakeFirst())
     fdatetime = scrapy.Field(output_processor=TakeFirst())
+
+
+class TestTypedItem(scrapy.Item):
+    # define the pyarrow types of the fields
+    ftext = scrapy.Field(
+        output_processor=TakeFirst(), arrow_type="string", dictionary=True
+    )
+    fint = scrapy.Field(output_processor=TakeFirst(), arrow_type="int32")
+    ffloat = scrapy.Field(output_processor=TakeFirst())
+
+
+class TestSerializerItem(scrapy.Item):
+    # define a serializer for a field
+    ftext = scrapy.Field(output_processor=TakeFirst(), serializer=str.upper)
+    fint = scrapy.Field(output_processor=TakeFirst())
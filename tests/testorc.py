@@ -32,8 +32,8 @@ import pyarrow.orc
 
 import scrapy
 from scrapy.loader import ItemLoader
-from zuinnote.scrapy.contrib.bigexporters import OrcItemExporter
-from .testitem import TestItem
+from zuinnote.scrapy.contrib.bigexporters import ArrowBulkItem, OrcItemExporter
+from .testitem import TestItem, TestTypedItem
 
 
 class TestOrcItemExporter(unittest.TestCase):
@@ -118,6 +118,124 @@ class TestOrcItemExporter(unittest.TestCase):
         )
         self.export_type_schema(itemExporter)
 
+    def test_orc_export_type_schema_declared(self):
+        """
+        Test if file is correctly written with a declared pyarrow schema
+        """
+        # create exporter
+        itemExporter = OrcItemExporter(
+            file=self.file,
+            no_items_batch=3,
+            convertallstrings=False,
+            compression="zstd",
+            schema=pyarrow.schema(
+                [
+                    ("ftext", pyarrow.string()),
+                    ("ftext_array", pyarrow.list_(pyarrow.string())),
+                    ("ffloat", pyarrow.float32()),
+                    ("fint", pyarrow.int32()),
+                    ("fbool", pyarrow.bool_()),
+                    ("fdatetime", pyarrow.timestamp("ms", tz="UTC")),
+                ]
+            ),
+        )
+        self.export_type_schema(itemExporter)
+        self.assertEqual(
+            pyarrow.int32(),
+            pyarrow.orc.ORCFile(self.filename).schema.field("fint").type,
+            msg="Declared schema is used",
+        )
+
+    def test_orc_export_item_field_types(self):
+        """
+        Test if the types declared in the item fields are used
+        """
+        # create exporter
+        itemExporter = OrcItemExporter(file=self.file, no_items_batch=3)
+        itemExporter.start_exporting()
+        for i in range(10):
+            l = ItemLoader(TestTypedItem())
+            l.add_value("ftext", f"text {i % 2}")
+            l.add_value("fint", i)
+            l.add_value("ffloat", float(i))
+            itemExporter.export_item(l.load_item())
+        itemExporter.finish_exporting()
+        self.file.close()
+        table = pyarrow.orc.read_table(self.filename)
+        self.assertEqual(
+            pyarrow.string(),
+            table.schema.field("ftext").type,
+            msg="String type (without dictionary) of the item field is used",
+        )
+        self.assertEqual(
+            pyarrow.int32(),
+            table.schema.field("fint").type,
+            msg="Int type of the item field is used",
+        )
+        self.assertEqual(
+            pyarrow.float64(),
+            table.schema.field("ffloat").type,
+            msg="Type of other fields is inferred",
+        )
+        self.assertEqual(
+            list(range(10)),
+            table.column("fint").to_pylist(),
+            msg="Int data is read correctly",
+        )
+
+    def test_orc_export_dictionary_columns(self):
+        """
+        Test if dictionary encoded columns are written with their value type
+        """
+        # create exporter
+        itemExporter = OrcItemExporter(
+            file=self.file, no_items_batch=3, dictionary_columns=["fauthor"]
+        )
+        itemExporter.start_exporting()
+        for i in range(10):
+            itemExporter.export_item(
+                {"fauthor": f"author {i % 2}" if i != 5 else None, "fint": i}
+            )
+        itemExporter.finish_exporting()
+        self.file.close()
+        table = pyarrow.orc.read_table(self.filename)
+        self.assertEqual(
+            pyarrow.string(),
+            table.schema.field("fauthor").type,
+            msg="Dictionary encoded column is written as string",
+        )
+        self.assertEqual(
+            [f"author {i % 2}" if i != 5 else None for i in range(10)],
+            table.column("fauthor").to_pylist(),
+            msg="Dictionary encoded data is read correctly",
+        )
+
+    def test_orc_export_bulk_item(self):
+        """
+        Test if the rows of bulk items are written
+        """
+        # create exporter
+        itemExporter = OrcItemExporter(file=self.file, no_items_batch=3)
+        itemExporter.start_exporting()
+        itemExporter.export_item(
+            ArrowBulkItem(
+                pyarrow.table({"ftext": ["bulk 0", "bulk 1"], "fint": [0, 1]})
+            )
+        )
+        itemExporter.export_item({"ftext": "item 2", "fint": 2})
+        itemExporter.finish_exporting()
+        self.file.close()
+        table = pyarrow.orc.read_table(self.filename)
+        self.assertEqual(
+            [
+                {"ftext": "bulk 0", "fint": 0},
+                {"ftext": "bulk 1", "fint": 1},
+                {"ftext": "item 2", "fint": 2},
+            ],
+            table.to_pylist(),
+            msg="Data is read correctly",
+        )
+
     def export_type_schema(self, itemExporter):
         itemExporter.start_exporting()
         # create and write some test data
@@ -23,7 +23,9 @@ SOFTWARE.
 import unittest
 import tempfile
 import datetime
+import json
 import os
+import shutil
 
 import scrapy
 
@@ -32,8 +34,8 @@ import pyarrow
 import pyarrow.parquet as pq
 
 from scrapy.loader import ItemLoader
-from zuinnote.scrapy.contrib.bigexporters import ParquetItemExporter
-from .testitem import TestItem
+from zuinnote.scrapy.contrib.bigexporters import ArrowBulkItem, ParquetItemExporter
+from .testitem import TestItem, TestSerializerItem, TestTypedItem
 
 
 class TestParquetItemExporter(unittest.TestCase):
@@ -94,6 +96,838 @@ class TestParquetItemExporter(unittest.TestCase):
         )
         self.export_type_schema(itemExporter)
 
+    def test_parquet_export_type_schema_declared(self):
+        """
+        Test if file is correctly written with a declared pyarrow schema
+        """
+        # create exporter
+        itemExporter = ParquetItemExporter(
+            file=self.file,
+            convertallstrings=False,
+            no_items_batch=3,
+            compression="zstd",
+            compression_level=3,
+            schema=pyarrow.schema(
+                [
+                    ("ftext", pyarrow.string()),
+                    ("ftext_array", pyarrow.list_(pyarrow.string())),
+                    ("ffloat", pyarrow.float32()),
+                    ("fint", pyarrow.int32()),
+                    ("fbool", pyarrow.bool_()),
+                    ("fdatetime", pyarrow.float64()),
+                ]
+            ),
+        )
+        self.export_type_schema(itemExporter)
+        self.assertEqual(
+            pyarrow.int32(),
+            pq.read_schema(self.filename).field("fint").type,
+            msg="Declared schema is used",
+        )
+
+    def test_parquet_export_item_field_types(self):
+        """
+        Test if the types declared in the item fields are used
+        """
+        # create exporter
+        itemExporter = ParquetItemExporter(file=self.file, no_items_batch=3)
+        itemExporter.start_exporting()
+        for i in range(10):
+            l = ItemLoader(TestTypedItem())
+            l.add_value("ftext", f"text {i % 2}")
+            l.add_value("fint", i)
+            l.add_value("ffloat", float(i))
+            itemExporter.export_item(l.load_item())
+        itemExporter.finish_exporting()
+        self.file.close()
+        table = pq.read_table(self.filename)
+        self.assertEqual(
+            pyarrow.dictionary(pyarrow.int32(), pyarrow.string()),
+            table.schema.field("ftext").type,
+            msg="String type (dictionary) of the item field is used",
+        )
+        self.assertEqual(
+            pyarrow.int32(),
+            table.schema.field("fint").type,
+            msg="Int type of the item field is used",
+        )
+        self.assertEqual(
+            pyarrow.float64(),
+            table.schema.field("ffloat").type,
+            msg="Type of other fields is inferred",
+        )
+        self.assertEqual(
+            list(range(10)),
+            table.column("fint").to_pylist(),
+            msg="Int data is read correctly",
+        )
+
+    def test_parquet_export_dictionary_columns(self):
+        """
+        Test if columns with few distinct values are dictionary encoded
+        """
+        # create exporter
+        itemExporter = ParquetItemExporter(
+            file=self.file,
+            no_items_batch=50,
+            dictionary_columns="auto",
+        )
+        itemExporter.start_exporting()
+        for i in range(100):
+            itemExporter.export_item(
+                {
+                    "fauthor": f"author {i % 3}" if i % 7 != 0 else None,
+                    "ftext": f"text {i}",
+                }
+            )
+        itemExporter.finish_exporting()
+        self.file.close()
+        table = pq.read_table(self.filename)
+        self.assertEqual(
+            pyarrow.dictionary(pyarrow.int32(), pyarrow.string()),
+            table.schema.field("fauthor").type,
+            msg="Column with few distinct values is dictionary encoded",
+        )
+        self.assertEqual(
+            pyarrow.string(),
+            table.schema.field("ftext").type,
+            msg="Column with many distinct values is not dictionary encoded",
+        )
+        self.assertEqual(
+            [f"author {i % 3}" if i % 7 != 0 else None for i in range(100)],
+            table.column("fauthor").to_pylist(),
+            msg="Dictionary encoded data is read correctly",
+        )
+
+    def test_parquet_export_field_serializer(self):
+        """
+        Test if the serializers of the item fields are applied and missing fields are empty
+        """
+        # create exporter
+        itemExporter = ParquetItemExporter(file=self.file, no_items_batch=3)
+        itemExporter.start_exporting()
+        for i in range(10):
+            l = ItemLoader(TestSerializerItem())
+            if i % 2 == 0:
+                l.add_value("ftext", f"text {i}")
+            l.add_value("fint", i)
+            itemExporter.export_item(l.load_item())
+        itemExporter.finish_exporting()
+        self.file.close()
+        table = pq.read_table(self.filename)
+        self.assertEqual(
+            [f"TEXT {i}" if i % 2 == 0 else "" for i in range(10)],
+            table.column("ftext").to_pylist(),
+            msg="Serializer is applied and missing fields are empty",
+        )
+        self.assertEqual(
+            list(range(10)),
+            table.column("fint").to_pylist(),
+            msg="Int data is read correctly",
+        )
+
+    def test_parquet_export_convertallstrings(self):
+        """
+        Test if all values are converted to strings as by str(value)
+        """
+        values = {
+            "ffloat": [10.0, 2.5, 1e-05, 1e16, -0.0, None],
+            "fint": [1, -2, 3, 2**40, 0, None],
+            "fbool": [True, False, None, True, False, True],
+            "fmixed": [1, 1.5, "text", ["a"], True, None],
+        }
+        # create exporter
+        itemExporter = ParquetItemExporter(
+            file=self.file, no_items_batch=4, convertallstrings=True
+        )
+        itemExporter.start_exporting()
+        for i in range(6):
+            itemExporter.export_item(
+                {column: column_values[i] for column, column_values in values.items()}
+            )
+        itemExporter.finish_exporting()
+        self.file.close()
+        table = pq.read_table(self.filename)
+        for column, column_values in values.items():
+            self.assertEqual(
+                [str(value) for value in column_values],
+                table.column(column).to_pylist(),
+                msg=f"Values of {column} are converted as by str",
+            )
+
+    def test_parquet_export_schema_inference(self):
+        """
+        Tests if the schema is inferred once from the first items
+        """
+        # create exporter
+        itemExporter = ParquetItemExporter(
+            file=self.file,
+            no_items_batch=3,
+            schema_inference_items=4,
+        )
+        itemExporter.start_exporting()
+        for i in range(10):
+            itemExporter.export_item(
+                {"fnumber": i if i != 1 else 1.5, "fempty": i if i > 3 else None}
+            )
+        itemExporter.finish_exporting()
+        self.file.close()
+        table = pq.read_table(self.filename)
+        self.assertEqual(
+            pyarrow.schema(
+                [("fnumber", pyarrow.float64()), ("fempty", pyarrow.string())]
+            ),
+            table.schema.remove_metadata(),
+            msg="Types are promoted and columns without values are strings",
+        )
+        self.assertEqual(
+            [None] * 4 + [str(i) for i in range(4, 10)],
+            table.column("fempty").to_pylist(),
+            msg="Values of columns without values in the sample are strings",
+        )
+
+    def test_parquet_export_schema_inference_error(self):
+        """
+        Tests if values that do not match the inferred schema raise an error
+        """
+        # create exporter
+        itemExporter = ParquetItemExporter(
+            file=self.file,
+            no_items_batch=3,
+            schema_inference_items=4,
+        )
+        itemExporter.start_exporting()
+        with self.assertRaises(RuntimeError):
+            for i in range(10):
+                itemExporter.export_item({"fint": i if i < 4 else "no int"})
+            itemExporter.finish_exporting()
+
+    def test_parquet_export_nested_types(self):
+        """
+        Test if lists and dicts are written as list and struct columns
+        """
+        # create exporter
+        itemExporter = ParquetItemExporter(
+            file=self.file, no_items_batch=3, schema_inference_items=2
+        )
+        itemExporter.start_exporting()
+        items = [
+            {
+                "ftags": [] if i < 2 else ["tag", str(i)],
+                "fmeta": {"score": i, "authors": [{"name": f"author {i}"}]},
+            }
+            for i in range(10)
+        ]
+        for item in items:
+            itemExporter.export_item(item)
+        itemExporter.finish_exporting()
+        self.file.close()
+        table = pq.read_table(self.filename)
+        self.assertEqual(
+            pyarrow.list_(pyarrow.string()),
+            table.schema.field("ftags").type,
+            msg="Empty lists in the first items are string lists",
+        )
+        self.assertEqual(
+            pyarrow.struct(
+                [
+                    ("score", pyarrow.int64()),
+                    (
+                        "authors",
+                        pyarrow.list_(pyarrow.struct([("name", pyarrow.string())])),
+                    ),
+                ]
+            ),
+            table.schema.field("fmeta").type,
+            msg="Dicts are struct columns",
+        )
+        self.assertEqual(items, table.to_pylist(), msg="Nested data is read correctly")
+
+    def test_parquet_export_nested_types_error(self):
+        """
+        Tests if keys of dicts that are not fields of the inferred struct type raise an error
+        """
+        # create exporter
+        itemExporter = ParquetItemExporter(
+            file=self.file, no_items_batch=3, schema_inference_items=2
+        )
+        itemExporter.start_exporting()
+        with self.assertRaises(RuntimeError):
+            for i in range(10):
+                fmeta = {"score": i}
+                if i > 4:
+                    fmeta["rating"] = 1.5
+                itemExporter.export_item({"fmeta": fmeta})
+            itemExporter.finish_exporting()
+
+    def test_parquet_export_bulk_item(self):
+        """
+        Test if the rows of bulk items are written in the order of the items
+        """
+        # create exporter
+        itemExporter = ParquetItemExporter(file=self.file, no_items_batch=3)
+        itemExporter.start_exporting()
+        itemExporter.export_item({"ftext": "item 0", "fint": 0})
+        itemExporter.export_item(
+            ArrowBulkItem(
+                pyarrow.record_batch(
+                    {
+                        "ftext": ["batch 1", "batch 2"],
+                        "fint": pyarrow.array([1, 2], type=pyarrow.int32()),
+                    }
+                )
+            )
+        )
+        itemExporter.export_item({"ftext": "item 3", "fint": 3})
+        itemExporter.export_item(
+            ArrowBulkItem({"ftext": ["dict 4", "dict 5"], "fint": [4, None]})
+        )
+        itemExporter.export_item(ArrowBulkItem(pyarrow.table({"fint": [6]})))
+        itemExporter.finish_exporting()
+        self.file.close()
+        table = pq.read_table(self.filename)
+        self.assertEqual(
+            pyarrow.schema([("ftext", pyarrow.string()), ("fint", pyarrow.int64())]),
+            table.schema.remove_metadata(),
+            msg="Bulk items are converted to the inferred schema",
+        )
+        self.assertEqual(
+            ["item 0", "batch 1", "batch 2", "item 3", "dict 4", "dict 5", None],
+            table.column("ftext").to_pylist(),
+            msg="String data is read correctly",
+        )
+        self.assertEqual(
+            [0, 1, 2, 3, 4, None, 6],
+            table.column("fint").to_pylist(),
+            msg="Int data is read correctly",
+        )
+
+    def test_parquet_export_bulk_item_error(self):
+        """
+        Tests if bulk items with columns that do not match the schema raise an error
+        """
+        # create exporter
+        itemExporter = ParquetItemExporter(file=self.file)
+        itemExporter.start_exporting()
+        itemExporter.export_item({"ftext": "item 0", "fint": 0})
+        with self.assertRaises(RuntimeError):
+            itemExporter.export_item(ArrowBulkItem({"fother": ["other"]}))
+        with self.assertRaises(RuntimeError):
+            itemExporter.export_item(ArrowBulkItem({"fint": ["no int"]}))
+
+    def test_parquet_export_type_schema_max_buffer_bytes(self):
+        """
+        Tests if row groups are written when the buffer exceeds the memory budget
+        """
+        # create exporter
+        itemExporter = ParquetItemExporter(
+            file=self.file,
+            convertallstrings=False,
+            no_items_batch=10000,
+            schema_inference_items=1,
+            max_buffer_bytes=300,
+            compression="zstd",
+            compression_level=3,
+        )
+        self.export_type_schema(itemExporter)
+        self.assertGreater(
+            pq.ParquetFile(self.filename).num_row_groups,
+            1,
+            msg="Row groups are written based on the memory budget",
+        )
+
+    def test_parquet_export_type_schema_async_write(self):
+        """
+        Tests if all records are written by the background writer thread
+        """
+        # create exporter
+        itemExporter = ParquetItemExporter(
+            file=self.file,
+            convertallstrings=False,
+            no_items_batch=3,
+            async_write=True,
+            compression="zstd",
+            compression_level=3,
+        )
+        self.export_type_schema(itemExporter)
+
+    def test_parquet_export_async_write_error(self):
+        """
+        Tests if an error in the background writer thread is raised when finishing
+        """
+        # create exporter
+        itemExporter = ParquetItemExporter(
+            file=self.file,
+            convertallstrings=False,
+            no_items_batch=3,
+            async_write=True,
+            schema=pyarrow.schema([("fint", pyarrow.timestamp("ms"))]),
+        )
+        itemExporter.start_exporting()
+        with self.assertRaises(RuntimeError):
+            for i in range(10):
+                l = ItemLoader(TestItem())
+                l.add_value("fint", "no timestamp")
+                itemExporter.export_item(l.load_item())
+            itemExporter.finish_exporting()
+
+    def test_parquet_export_sorting_columns(self):
+        """
+        Tests if rows are sorted within row groups by the sorting columns
+        """
+        # create exporter
+        itemExporter = ParquetItemExporter(
+            file=self.file,
+            convertallstrings=False,
+            no_items_batch=4,
+            schema_inference_items=1,
+            sorting_columns=[pq.SortingColumn(3, descending=True)],
+        )
+        itemExporter.start_exporting()
+        for i in range(10):
+            l = ItemLoader(TestItem())
+            l.add_value("ftext", f"text {i}")
+            l.add_value("fint", i)
+            itemExporter.export_item(l.load_item())
+        itemExporter.finish_exporting()
+        self.file.close()
+        parquet_file = pq.ParquetFile(self.filename)
+        self.assertEqual(
+            [[4, 3, 2, 1, 0], [9, 8, 7, 6, 5]],
+            [
+                parquet_file.read_row_group(i).column("fint").to_pylist()
+                for i in range(parquet_file.num_row_groups)
+            ],
+            msg="Rows are sorted within row groups",
+        )
+        self.assertEqual(
+            (pq.SortingColumn(3, descending=True),),
+            parquet_file.metadata.row_group(0).sorting_columns,
+            msg="Sorting columns are written",
+        )
+
+    def test_parquet_export_global_sort(self):
+        """
+        Tests if all rows are sorted by merging the sorted runs spilled to disk
+        """
+        spill_directory = tempfile.mkdtemp()
+        try:
+            # create exporter
+            itemExporter = ParquetItemExporter(
+                file=self.file,
+                convertallstrings=False,
+                no_items_batch=3,
+                global_sort=True,
+                sorting_columns=[pq.SortingColumn(3)],
+                spill_directory=spill_directory,
+                spill_chunk_rows=2,
+            )
+            itemExporter.start_exporting()
+            for i in [7, 3, 9, 0, 5, 8, 1, 6, 2, 4]:
+                l = ItemLoader(TestItem())
+                l.add_value("fint", i)
+                itemExporter.export_item(l.load_item())
+            itemExporter.finish_exporting()
+            self.file.close()
+            self.assertEqual(
+                list(range(10)),
+                pq.read_table(self.filename).column("fint").to_pylist(),
+                msg="All rows are sorted",
+            )
+            self.assertEqual(
+                [], os.listdir(spill_directory), msg="Sorted runs are removed"
+            )
+        finally:
+            shutil.rmtree(spill_directory)
+
+    def test_parquet_export_global_sort_fan_in(self):
+        """
+        Tests if more sorted runs than the fan-in are merged in several passes
+        """
+        spill_directory = tempfile.mkdtemp()
+        try:
+            # create exporter
+            itemExporter = ParquetItemExporter(
+                file=self.file,
+                no_items_batch=1,
+                schema_inference_items=1,
+                global_sort=True,
+                sorting_columns=[pq.SortingColumn(0, descending=True)],
+                spill_directory=spill_directory,
+                spill_fan_in=2,
+            )
+            itemExporter.start_exporting()
+            for i in [7, 3, 9, 0, 5, 8, 1, 6, 2, 4, None]:
+                itemExporter.export_item({"fint": i})
+            itemExporter._flush_table()
+            self.assertEqual(
+                6, len(itemExporter.spill_runs), msg="Sorted runs are spilled"
+            )
+            itemExporter.finish_exporting()
+            self.file.close()
+            self.assertEqual(
+                list(range(9, -1, -1)) + [None],
+                pq.read_table(self.filename).column("fint").to_pylist(),
+                msg="All rows are sorted",
+            )
+            self.assertEqual(
+                [], os.listdir(spill_directory), msg="Sorted runs are removed"
+            )
+        finally:
+            shutil.rmtree(spill_directory)
+
+    def test_parquet_export_global_sort_run_field(self):
+        """
+        Tests if items can have fields with any name when merging the sorted runs
+        """
+        # create exporter
+        itemExporter = ParquetItemExporter(
+            file=self.file,
+            convertallstrings=False,
+            no_items_batch=3,
+            global_sort=True,
+            sorting_columns=[pq.SortingColumn(0)],
+            spill_chunk_rows=2,
+        )
+        itemExporter.start_exporting()
+        for i in [7, 3, 9, 0, 5, 8, 1, 6, 2, 4]:
+            itemExporter.export_item({"fint": i, "__run": f"run {i}"})
+        itemExporter.finish_exporting()
+        self.file.close()
+        table = pq.read_table(self.filename)
+        self.assertEqual(
+            list(range(10)), table.column("fint").to_pylist(), msg="All rows are sorted"
+        )
+        self.assertEqual(
+            [f"run {i}" for i in range(10)],
+            table.column("__run").to_pylist(),
+            msg="Field __run of the items is written",
+        )
+
+    def test_parquet_export_global_sort_async_error(self):
+        """
+        Tests if the sorted runs are removed if writing in the background fails
+        """
+        spill_directory = tempfile.mkdtemp()
+        try:
+            # create exporter
+            itemExporter = ParquetItemExporter(
+                file=self.file,
+                no_items_batch=3,
+                schema=pyarrow.schema([("fint", pyarrow.int64())]),
+                async_write=True,
+                global_sort=True,
+                sorting_columns=[pq.SortingColumn(0)],
+                spill_directory=spill_directory,
+            )
+            itemExporter.start_exporting()
+            with self.assertRaises(RuntimeError):
+                for i in range(7):
+                    itemExporter.export_item({"fint": i})
+                itemExporter.export_item({"fint": "not a number"})
+                itemExporter.finish_exporting()
+            self.assertEqual(
+                [], os.listdir(spill_directory), msg="Sorted runs are removed"
+            )
+        finally:
+            shutil.rmtree(spill_directory)
+
+    def test_parquet_export_schema_inference_per_batch(self):
+        """
+        Tests if the schema is inferred for each batch if schema_inference_items is None, also with dictionary columns
+        """
+        tempdirectory = tempfile.mkdtemp()
+        try:
+            # create exporter
+            itemExporter = ParquetItemExporter(
+                file=self.file,
+                no_items_batch=1,
+                schema_inference_items=None,
+                dictionary_columns=["ftext"],
+                rolling_max_rows=2,
+                rolling_path=os.path.join(tempdirectory, "part-{part:05d}.parquet"),
+            )
+            itemExporter.start_exporting()
+            for text, number in [("a", 1), ("b", 2), ("c", 1.5), ("d", 2.5)]:
+                itemExporter.export_item({"ftext": text, "fnumber": number})
+            itemExporter.finish_exporting()
+            self.file.close()
+            with open(self.filename, "rb") as f:
+                d = json.load(f)
+            schemas = [pq.read_schema(part) for part in d["files"]]
+            self.assertEqual(
+                [pyarrow.int64(), pyarrow.float64()],
+                [schema.field("fnumber").type for schema in schemas],
+                msg="Schema is inferred for each batch",
+            )
+            self.assertEqual(
+                [True, True],
+                [
+                    pyarrow.types.is_dictionary(schema.field("ftext").type)
+                    for schema in schemas
+                ],
+                msg="Dictionary columns are dictionary encoded in each batch",
+            )
+        finally:
+            shutil.rmtree(tempdirectory)
+
+    def test_parquet_export_schema_inference_across_batches(self):
+        """
+        Tests if the schema is inferred from schema_inference_items items even if a batch has fewer items
+        """
+        # create exporter
+        itemExporter = ParquetItemExporter(
+            file=self.file,
+            no_items_batch=2,
+            max_buffer_bytes=1,
+            schema_inference_items=10,
+        )
+        itemExporter.start_exporting()
+        for i in [None, None, None, 3, 4, 5]:
+            itemExporter.export_item({"fint": i})
+        self.assertEqual(
+            0, self.file.tell(), msg="Nothing is written before the sample is complete"
+        )
+        itemExporter.finish_exporting()
+        self.file.close()
+        table = pq.read_table(self.filename)
+        self.assertEqual(
+            pyarrow.int64(),
+            table.schema.field("fint").type,
+            msg="Type is inferred from the values after the first batch",
+        )
+        self.assertEqual(
+            [None, None, None, 3, 4, 5],
+            table.column("fint").to_pylist(),
+            msg="Values keep their type",
+        )
+
+    def test_parquet_export_rolling_max_rows(self):
+        """
+        Tests if part files are written once the maximum number of rows is reached
+        """
+        tempdirectory = tempfile.mkdtemp()
+        try:
+            # create exporter
+            itemExporter = ParquetItemExporter(
+                file=self.file,
+                convertallstrings=False,
+                no_items_batch=3,
+                rolling_max_rows=4,
+                rolling_path=os.path.join(tempdirectory, "part-{part:05d}.parquet"),
+            )
+            itemExporter.start_exporting()
+            for i in range(10):
+                l = ItemLoader(TestItem())
+                l.add_value("fint", i)
+                itemExporter.export_item(l.load_item())
+            itemExporter.finish_exporting()
+            self.file.close()
+            with open(self.filename, "rb") as f:
+                d = json.load(f)
+            self.assertEqual(10, d["noitems"], msg="Number of items is written")
+            self.assertEqual(
+                [
+                    os.path.join(tempdirectory, f"part-{part:05d}.parquet")
+                    for part in range(1, 4)
+                ],
+                d["files"],
+                msg="Part files are written",
+            )
+            self.assertEqual(
+                [4, 4, 2],
+                [pq.read_metadata(part).num_rows for part in d["files"]],
+                msg="Part files contain at most the maximum number of rows",
+            )
+            self.assertEqual(
+                list(range(10)),
+                pq.read_table(d["files"]).column("fint").to_pylist(),
+                msg="All records are written in order",
+            )
+        finally:
+            shutil.rmtree(tempdirectory)
+
+    def test_parquet_export_rolling_same_directory(self):
+        """
+        Tests if part files of two exporters writing to the same directory do not overwrite each other
+        """
+        tempdirectory = tempfile.mkdtemp()
+        try:
+            files = []
+            for feed in ["items-1.parquet", "items-2.parquet"]:
+                with open(os.path.join(tempdirectory, feed), "wb") as f:
+                    # create exporter
+                    itemExporter = ParquetItemExporter(
+                        file=f,
+                        convertallstrings=False,
+                        no_items_batch=3,
+                        rolling_max_rows=4,
+                    )
+                    itemExporter.start_exporting()
+                    for i in range(5):
+                        l = ItemLoader(TestItem())
+                        l.add_value("ftext", feed)
+                        l.add_value("fint", i)
+                        itemExporter.export_item(l.load_item())
+                    itemExporter.finish_exporting()
+                with open(os.path.join(tempdirectory, feed), "rb") as f:
+                    files.append(json.load(f)["files"])
+            self.assertEqual(
+                [
+                    [
+                        os.path.join(
+                            tempdirectory, f"items-{feed}-part-{part:05d}.parquet"
+                        )
+                        for part in range(1, 3)
+                    ]
+                    for feed in range(1, 3)
+                ],
+                files,
+                msg="Part files are named after the exported file",
+            )
+            for feed, parts in zip(["items-1.parquet", "items-2.parquet"], files):
+                self.assertEqual(
+                    [feed] * 5,
+                    pq.read_table(parts).column("ftext").to_pylist(),
+                    msg="Part files are not overwritten by another exporter",
+                )
+        finally:
+            shutil.rmtree(tempdirectory)
+
+    def test_parquet_export_partition_cols(self):
+        """
+        Tests if a Hive-style partitioned dataset is written
+        """
+        tempdirectory = tempfile.mkdtemp()
+        try:
+            # create exporter
+            itemExporter = ParquetItemExporter(
+                file=self.file,
+                convertallstrings=False,
+                no_items_batch=3,
+                partition_cols=["fint"],
+                partition_max_open_files=1,
+                rolling_path=os.path.join(tempdirectory, "part-{part:05d}.parquet"),
+            )
+            itemExporter.start_exporting()
+            for i in range(10):
+                l = ItemLoader(TestItem())
+                l.add_value("ftext", f"text {i}")
+                l.add_value("fint", i % 2)
+                itemExporter.export_item(l.load_item())
+            itemExporter.finish_exporting()
+            self.file.close()
+            self.assertEqual(
+                ["fint=0", "fint=1"],
+                sorted(os.listdir(tempdirectory)),
+                msg="One directory is written per partition",
+            )
+            df = pq.read_table(tempdirectory, partitioning="hive").to_pandas()
+            self.assertEqual(
+                [f"text {i}" for i in range(10)],
+                sorted(df["ftext"], key=lambda text: int(text.split()[1])),
+                msg="All records are written",
+            )
+            self.assertEqual(
+                [i % 2 for i in range(10)],
+                [
+                    int(fint)
+                    for _, fint in sorted(
+                        zip(df["ftext"], df["fint"]),
+                        key=lambda row: int(row[0].split()[1]),
+                    )
+                ],
+                msg="Records are written to their partition",
+            )
+        finally:
+            shutil.rmtree(tempdirectory)
+
+    def test_parquet_export_partition_cols_sorting_columns(self):
+        """
+        Tests if the sorting columns refer to the columns of the items if partition columns are removed
+        """
+        for global_sort in [False, True]:
+            tempdirectory = tempfile.mkdtemp()
+            try:
+                with open(os.path.join(tempdirectory, "items.json"), "wb") as f:
+                    # create exporter
+                    itemExporter = ParquetItemExporter(
+                        file=f,
+                        no_items_batch=3,
+                        partition_cols=["domain"],
+                        sorting_columns=[pq.SortingColumn(0), pq.SortingColumn(1)],
+                        global_sort=global_sort,
+                    )
+                    itemExporter.start_exporting()
+                    for i in [7, 3, 9, 0, 5, 8, 1, 6, 2, 4]:
+                        itemExporter.export_item(
+                            {
+                                "domain": f"example{i % 2}.com",
+                                "score": i,
+                                "url": f"https://example{i % 2}.com/{9 - i}",
+                            }
+                        )
+                    itemExporter.finish_exporting()
+                with open(os.path.join(tempdirectory, "items.json"), "rb") as f:
+                    parts = json.load(f)["files"]
+                for part in parts:
+                    parquet_file = pq.ParquetFile(part)
+                    self.assertEqual(
+                        (pq.SortingColumn(0),),
+                        parquet_file.metadata.row_group(0).sorting_columns,
+                        msg="Partition column is removed from the sorting columns",
+                    )
+                    if global_sort:
+                        scores = parquet_file.read().column("score").to_pylist()
+                        self.assertEqual(
+                            sorted(scores), scores, msg="Rows are sorted by score"
+                        )
+                    for i in range(parquet_file.num_row_groups):
+                        scores = (
+                            parquet_file.read_row_group(i).column("score").to_pylist()
+                        )
+                        self.assertEqual(
+                            sorted(scores),
+                            scores,
+                            msg="Rows of row groups are sorted by score",
+                        )
+            finally:
+                shutil.rmtree(tempdirectory)
+
+    def test_parquet_export_sorting_columns_nulls_first(self):
+        """
+        Tests if sorting columns can have different null placements
+        """
+        # create exporter
+        itemExporter = ParquetItemExporter(
+            file=self.file,
+            no_items_batch=10,
+            sorting_columns=[
+                pq.SortingColumn(0, nulls_first=True),
+                pq.SortingColumn(1, nulls_first=False),
+            ],
+        )
+        itemExporter.start_exporting()
+        for a, b in [(1, None), (None, 2), (1, 1), (None, None)]:
+            itemExporter.export_item({"a": a, "b": b})
+        itemExporter.finish_exporting()
+        self.file.close()
+        table = pq.read_table(self.filename)
+        self.assertEqual(
+            [(None, 2), (None, None), (1, 1), (1, None)],
+            list(zip(table.column("a").to_pylist(), table.column("b").to_pylist())),
+            msg="Nulls are placed per sorting column",
+        )
+
+    def test_parquet_export_partition_max_open_files_invalid(self):
+        """
+        Tests if an invalid maximum number of open part files is rejected
+        """
+        with self.assertRaises(RuntimeError):
+            ParquetItemExporter(
+                file=self.file, partition_cols=["fint"], partition_max_open_files=0
+            )
+
     def export_type_schema(self, itemExporter):
         itemExporter.start_exporting()
         # create and write some test data
@@ -0,0 +1,745 @@
+"""
+Copyright (c) 2026 ZuInnoTe (Jörn Franke) <oss@zuinnote.eu>
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+"""
+Internal batch builder shared by the pyarrow based exporters (Parquet, Orc, Iceberg)
+"""
+
+import array
+import threading
+
+import pyarrow
+import pyarrow.compute as pc
+
+from zuinnote.scrapy.contrib._estimate import estimate_size
+
+
+def to_string_array(values):
+    """
+    Converts values to a pyarrow string array. Each value is converted as by str(value). Integers, floats, booleans and strings are converted by pyarrow, other values in Python
+    """
+    try:
+        array = pyarrow.array(values)
+    except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError, OverflowError):
+        array = None
+    if array is None:
+        strings = None
+    elif pyarrow.types.is_string(array.type):
+        strings = array
+    elif pyarrow.types.is_integer(array.type):
+        strings = pc.cast(array, pyarrow.string())
+    elif pyarrow.types.is_boolean(array.type):
+        strings = pc.if_else(array, "True", "False")
+    elif pyarrow.types.is_null(array.type):
+        strings = pyarrow.nulls(len(array), pyarrow.string())
+    elif pyarrow.types.is_floating(array.type) and all(
+        type(value) is float for value in values if value is not None
+    ):
+        # pyarrow infers double for int and float values, but str(1) is not "1.0"
+        strings = _float_to_string_array(array, values)
+    else:
+        strings = None
+    if strings is None:
+        return pyarrow.array([str(value) for value in values], type=pyarrow.string())
+    # str(None)
+    return strings.fill_null("None")
+
+
+def _float_to_string_array(array, values):
+    """
+    Converts a pyarrow double array to a pyarrow string array as by str(value)
+    """
+    strings = pc.cast(array, pyarrow.string())
+    # pyarrow converts e.g. 10.0 to "10"
+    integral = pc.invert(pc.match_substring_regex(strings, r"[.en]"))
+    strings = pc.if_else(
+        integral, pc.binary_join_element_wise(strings, ".0", ""), strings
+    )
+    # Python uses the scientific notation only for exponents < -4 and >= 16
+    absolute = pc.abs(array)
+    scientific = pc.or_(
+        pc.match_substring(strings, "e"),
+        pc.or_(
+            pc.and_(pc.less(absolute, 1e-4), pc.not_equal(absolute, 0)),
+            pc.greater_equal(absolute, 1e16),
+        ),
+    ).fill_null(False)
+    indices = pc.indices_nonzero(scientific).to_pylist()
+    if len(indices) > 0:
+        strings = pc.replace_with_mask(
+            strings,
+            scientific,
+            pyarrow.array(
+                [str(values[index]) for index in indices], type=pyarrow.string()
+            ),
+        )
+    return strings
+
+
+def get_item_fields(item, columns):
+    """
+    Returns the pyarrow fields declared in the metadata of the fields of a scrapy Item, e.g. scrapy.Field(arrow_type=pyarrow.int32(), nullable=False, dictionary=True)
+    """
+    item_fields = {}
+    if not hasattr(item, "fields"):
+        # dicts and bulk items
+        return item_fields
+    for column in columns:
+        metadata = item.fields.get(column, {})
+        if metadata.get("arrow_type", None) is None:
+            continue
+        arrow_type = metadata["arrow_type"]
+        if isinstance(arrow_type, str):
+            # e.g. "int32" or "string"
+            arrow_type = pyarrow.type_for_alias(arrow_type)
+        if metadata.get("dictionary", False):
+            arrow_type = pyarrow.dictionary(pyarrow.int32(), arrow_type)
+        item_fields[column] = pyarrow.field(
+            column, arrow_type, nullable=metadata.get("nullable", True)
+        )
+    return item_fields
+
+
+def decode_dictionary_schema(schema):
+    """
+    Returns the schema with the value types of dictionary columns instead of the dictionary types
+    """
+    return pyarrow.schema(
+        [
+            (
+                pyarrow.field(
+                    field.name, field.type.value_type, nullable=field.nullable
+                )
+                if pyarrow.types.is_dictionary(field.type)
+                else field
+            )
+            for field in schema
+        ],
+        metadata=schema.metadata,
+    )
+
+
+def decode_dictionaries(data):
+    """
+    Converts the dictionary columns of a pyarrow.RecordBatch or pyarrow.Table to columns of the value type, e.g. for formats without dictionary types
+    """
+    schema = decode_dictionary_schema(data.schema)
+    if schema.equals(data.schema):
+        return data
+    return data.cast(schema)
+
+
+class DictionaryBuffer:
+    """
+    Buffers the values of a column as dictionary indices and a table of the distinct values
+    """
+
+    def __init__(self):
+        """
+        Initialize dictionary buffer
+        """
+        self.indices = array.array("i")  # index of each value, -1 for None
+        self.dictionary = {}  # distinct values and their index
+        self.dictionary_nbytes = 0  # estimated bytes of the distinct values
+        self.null_count = 0
+
+    def __len__(self):
+        """
+        Number of values in the buffer
+        """
+        return len(self.indices)
+
+    def append(self, value):
+        """
+        Append a value to the buffer
+        """
+        if value is None:
+            self.indices.append(-1)
+            self.null_count += 1
+            return
+        try:
+            index = self.dictionary.get(value, None)
+        except TypeError as e:
+            raise RuntimeError(
+                f"Error: Values of dictionary columns must be hashable, but got {type(value).__name__}"
+            ) from e
+        if index is None:
+            index = len(self.dictionary)
+            self.dictionary[value] = index
+            self.dictionary_nbytes += estimate_size(value)
+        self.indices.append(index)
+
+    @property
+    def nbytes(self):
+        """
+        Estimated number of bytes of the indices and distinct values
+        """
+        return self.indices.itemsize * len(self.indices) + self.dictionary_nbytes
+
+    def to_array(self, arrow_type, safe=True, convert=None):
+        """
+        Convert the buffer to a pyarrow.DictionaryArray of the given dictionary type. Optionally, convert is applied to each distinct value
+        """
+        values = list(self.dictionary)
+        if convert is not None:
+            values = [convert(value) for value in values]
+        indices = pyarrow.Array.from_buffers(
+            pyarrow.int32(), len(self.indices), [None, pyarrow.py_buffer(self.indices)]
+        )
+        if self.null_count > 0:
+            indices = pc.if_else(
+                pc.less(indices, 0), pyarrow.scalar(None, pyarrow.int32()), indices
+            )
+        return pyarrow.DictionaryArray.from_arrays(
+            indices.cast(arrow_type.index_type),
+            pyarrow.array(values, type=arrow_type.value_type, safe=safe),
+        )
+
+
+def _is_arrow(values):
+    """
+    Returns if values are a pyarrow array
+    """
+    return isinstance(values, (pyarrow.Array, pyarrow.ChunkedArray))
+
+
+def _resolve_null_types(arrow_type):
+    """
+    Replaces the null types of nested fields, e.g. of empty lists, by string
+    """
+    if pyarrow.types.is_null(arrow_type):
+        return pyarrow.string()
+    if pyarrow.types.is_list(arrow_type):
+        return pyarrow.list_(_resolve_null_types(arrow_type.value_type))
+    if pyarrow.types.is_large_list(arrow_type):
+        return pyarrow.large_list(_resolve_null_types(arrow_type.value_type))
+    if pyarrow.types.is_struct(arrow_type):
+        return pyarrow.struct(
+            [field.with_type(_resolve_null_types(field.type)) for field in arrow_type]
+        )
+    return arrow_type
+
+
+def _has_struct(arrow_type):
+    """
+    Returns if a type is or contains a struct type
+    """
+    if pyarrow.types.is_struct(arrow_type):
+        return True
+    if pyarrow.types.is_list(arrow_type) or pyarrow.types.is_large_list(arrow_type):
+        return _has_struct(arrow_type.value_type)
+    return False
+
+
+def _find_unknown_struct_field(values, arrow_type):
+    """
+    Returns the name of the first key of a dict in values that is not a field of the (nested) struct type. pyarrow ignores such keys
+    """
+    if pyarrow.types.is_struct(arrow_type):
+        names = {field.name for field in arrow_type}
+        dicts = [value for value in values if isinstance(value, dict)]
+        for value in dicts:
+            for key in value:
+                if key not in names:
+                    return key
+        for field in arrow_type:
+            if _has_struct(field.type):
+                key = _find_unknown_struct_field(
+                    [value.get(field.name, None) for value in dicts], field.type
+                )
+                if key is not None:
+                    return f"{field.name}.{key}"
+    elif pyarrow.types.is_list(arrow_type) or pyarrow.types.is_large_list(arrow_type):
+        return _find_unknown_struct_field(
+            [element for value in values if value is not None for element in value],
+            arrow_type.value_type,
+        )
+    return None
+
+
+def _find_unknown_struct_type_field(arrow_type, target_type):
+    """
+    Returns the name of the first field of a (nested) struct type that is not a field of the target struct type. pyarrow ignores such fields when casting
+    """
+    if pyarrow.types.is_struct(arrow_type) and pyarrow.types.is_struct(target_type):
+        for field in arrow_type:
+            if target_type.get_field_index(field.name) < 0:
+                return field.name
+            name = _find_unknown_struct_type_field(
+                field.type, target_type.field(field.name).type
+            )
+            if name is not None:
+                return f"{field.name}.{name}"
+    elif (
+        pyarrow.types.is_list(arrow_type) or pyarrow.types.is_large_list(arrow_type)
+    ) and (
+        pyarrow.types.is_list(target_type) or pyarrow.types.is_large_list(target_type)
+    ):
+        return _find_unknown_struct_type_field(
+            arrow_type.value_type, target_type.value_type
+        )
+    return None
+
+
+class ArrowSchemaInference:
+    """
+    Infers a pyarrow schema from the first items and caches it for all following batches of an exporter.
+    If sample_items is None then the schema is inferred from all items of each batch separately and not cached
+    """
+
+    def __init__(
+        self,
+        sample_items=10000,
+        item_fields=None,
+        dictionary_columns=None,
+        dictionary_max_cardinality=0.1,
+    ):
+        """
+        Initialize schema inference
+        """
+        self.sample_items = sample_items  # number of items to infer the schema from, None for each batch
+        self.item_fields = item_fields or {}  # declared fields, which are not inferred
+        # list of dictionary encoded columns or "auto" to choose string columns with few distinct values
+        self.dictionary_columns = dictionary_columns
+        self.dictionary_max_cardinality = dictionary_max_cardinality
+        self.schema = None  # inferred schema (only if cached)
+        self.string_columns = set()  # columns without values in the sample
+        self.lock = threading.Lock()
+
+    def get_dictionary_columns(self):
+        """
+        Returns the columns that are buffered as dictionary indices
+        """
+        with self.lock:
+            if self.schema is not None:
+                return {
+                    field.name
+                    for field in self.schema
+                    if pyarrow.types.is_dictionary(field.type)
+                }
+        columns = {
+            column
+            for column, field in self.item_fields.items()
+            if pyarrow.types.is_dictionary(field.type)
+        }
+        if self.dictionary_columns is not None and self.dictionary_columns != "auto":
+            columns.update(self.dictionary_columns)
+        return columns
+
+    def is_pending(self, itemcount):
+        """
+        Returns if the schema is not inferred yet and itemcount items are fewer than the items needed to infer it
+        """
+        with self.lock:
+            return (
+                self.schema is None
+                and self.sample_items is not None
+                and itemcount < self.sample_items
+            )
+
+    def get_schema(self, buffer):
+        """
+        Returns the cached schema or infers it from the first items in the column buffers
+        """
+        with self.lock:
+            if self.schema is None:
+                string_columns = set()
+                fields = []
+                for column, values in buffer.items():
+                    if column in self.item_fields:
+                        fields.append(self.item_fields[column])
+                        continue
+                    if _is_arrow(values):
+                        # columns of bulk items have a type
+                        column_type = values.type
+                    elif isinstance(values, DictionaryBuffer):
+                        # the distinct values have the same type as all values
+                        sample = list(values.dictionary)[: self.sample_items]
+                        column_type = pyarrow.array(sample).type
+                    else:
+                        sample = values[: self.sample_items]
+                        # pyarrow promotes types, e.g. int and float values to double, and merges the keys of dicts to struct fields
+                        column_type = pyarrow.array(sample).type
+                    if pyarrow.types.is_null(column_type):
+                        # the type is unknown, values are stored as string
+                        column_type = pyarrow.string()
+                        string_columns.add(column)
+                    column_type = _resolve_null_types(column_type)
+                    if pyarrow.types.is_dictionary(column_type):
+                        pass
+                    elif self._is_dictionary_column(column, values, column_type):
+                        column_type = pyarrow.dictionary(pyarrow.int32(), column_type)
+                    fields.append(pyarrow.field(column, column_type, nullable=True))
+                self.string_columns = string_columns
+                if self.sample_items is None:
+                    # infer the schema again for the next batch
+                    return pyarrow.schema(fields)
+                self.schema = pyarrow.schema(fields)
+            return self.schema
+
+    def _is_dictionary_column(self, column, values, column_type):
+        """
+        Returns if a column is dictionary encoded. In auto mode, string columns are dictionary encoded if the ratio of distinct values to values in the sample does not exceed dictionary_max_cardinality
+        """
+        if isinstance(values, DictionaryBuffer):
+            return True
+        if self.dictionary_columns is None:
+            return False
+        if self.dictionary_columns != "auto":
+            return column in self.dictionary_columns
+        if not pyarrow.types.is_string(column_type):
+            return False
+        if _is_arrow(values):
+            values = values.slice(0, self.sample_items).to_pylist()
+        sample = [value for value in values[: self.sample_items] if value is not None]
+        return (
+            len(sample) > 0
+            and len(set(sample)) <= len(sample) * self.dictionary_max_cardinality
+        )
+
+
+class ArrowBatchBuilder:
+    """
+    Buffers the values of items per column and converts them to a pyarrow.RecordBatch
+    """
+
+    def __init__(
+        self,
+        columns,
+        schema=None,
+        safe=True,
+        convertallstrings=False,
+        estimate_nbytes=False,
+        schema_inference=None,
+    ):
+        """
+        Initialize batch builder
+        """
+        self.columns = columns  # columns to buffer
+        self.schema = schema  # optional declared pyarrow schema
+        self.safe = safe  # safe conversion to the declared schema
+        self.convertstr = convertallstrings
+        self.estimate_nbytes = estimate_nbytes  # track buffered bytes per column
+        self.schema_inference = schema_inference  # optional shared schema inference
+        self.reset()
+
+    def __len__(self):
+        """
+        Number of items and rows of bulk items in the buffer
+        """
+        return self.itemcount + self.table_rows
+
+    def reset(self):
+        """
+        Reset column buffers and bulk items
+        """
+        self._reset_buffer()
+        self.tables = []  # converted items and bulk items in the order of appending
+        self.table_rows = 0
+        self.table_nbytes = 0
+
+    def _reset_buffer(self):
+        """
+        Reset column buffers
+        """
+        dictionary_columns = self._get_dictionary_columns()
+        self.buffer = {
+            column: DictionaryBuffer() if column in dictionary_columns else []
+            for column in self.columns
+        }
+        self.column_nbytes = {column: 0 for column in self.columns}
+        self.itemcount = 0
+
+    def _get_dictionary_columns(self):
+        """
+        Returns the columns that are buffered as dictionary indices
+        """
+        if self.convertstr == True:
+            return set()
+        if self.schema is not None:
+            return {
+                field.name
+                for field in self.schema
+                if pyarrow.types.is_dictionary(field.type)
+            }
+        if self.schema_inference is not None:
+            return self.schema_inference.get_dictionary_columns()
+        return set()
+
+    @property
+    def schema_pending(self):
+        """
+        True if the schema is inferred from the first items, but fewer items are buffered. The buffer should not be converted before, otherwise the schema is inferred from less items
+        """
+        return (
+            self.schema is None
+            and self.convertstr != True
+            and self.schema_inference is not None
+            and self.schema_inference.is_pending(len(self))
+        )
+
+    @property
+    def nbytes(self):
+        """
+        Estimated number of bytes in the buffer (only if estimate_nbytes is set)
+        """
+        return self.table_nbytes + sum(
+            (
+                values.nbytes
+                if isinstance(values, DictionaryBuffer)
+                else self.column_nbytes[column]
+            )
+            for column, values in self.buffer.items()
+        )
+
+    def append(self, fields):
+        """
+        Append the serialized fields of an item to the column buffers
+        """
+        for column, values in self.buffer.items():
+            value = fields.get(column, None)
+            values.append(value)
+            if self.estimate_nbytes:
+                self.column_nbytes[column] += estimate_size(value)
+        self.itemcount += 1
+
+    def append_values(self, values):
+        """
+        Append the serialized values of an item in the order of the columns to the column buffers
+        """
+        for column, column_values, value in zip(
+            self.columns, self.buffer.values(), values
+        ):
+            column_values.append(value)
+            if self.estimate_nbytes:
+                self.column_nbytes[column] += estimate_size(value)
+        self.itemcount += 1
+
+    def append_bulk(self, data):
+        """
+        Append the rows of a pyarrow.RecordBatch, pyarrow.Table or dict of lists (column: values) to the buffer. The columns are converted to the schema of the buffer as a whole
+        """
+        names = list(data) if isinstance(data, dict) else data.schema.names
+        unknown = [name for name in names if name not in self.columns]
+        if len(unknown) > 0:
+            raise RuntimeError(
+                f"Error: Columns {unknown} of the bulk item are not columns of the export"
+            )
+        # keep the order of items and bulk items. The schema is inferred from the first of them
+        self._convert_buffer()
+        table = self._to_bulk_table(data)
+        if table.num_rows == 0:
+            return
+        self.tables.append(table)
+        self.table_rows += table.num_rows
+        if self.estimate_nbytes:
+            self.table_nbytes += table.nbytes
+
+    def _convert_buffer(self):
+        """
+        Convert the column buffers to a pyarrow.Table that is stored with the bulk items
+        """
+        if self.itemcount > 0:
+            table = pyarrow.Table.from_batches([self._to_record_batch()])
+            self.tables.append(table)
+            self.table_rows += table.num_rows
+            if self.estimate_nbytes:
+                self.table_nbytes += table.nbytes
+            self._reset_buffer()
+
+    def _to_bulk_table(self, data):
+        """
+        Convert the columns of a bulk item to a pyarrow.Table with the schema of the buffer
+        """
+        if isinstance(data, dict):
+            # values of a column are a list or a pyarrow array
+            columns = data
+            num_rows = len(next(iter(data.values()), []))
+        else:
+            columns = {name: data.column(name) for name in data.schema.names}
+            num_rows = data.num_rows
+        if self.convertstr == True:
+            # values are converted as by str(value), missing values of items are None
+            strings = {}
+            for column in self.columns:
+                values = columns.get(column, [None] * num_rows)
+                strings[column] = to_string_array(
+                    values.to_pylist() if _is_arrow(values) else list(values)
+                )
+            columns = strings
+            schema = self.schema
+            if schema is None:
+                schema = pyarrow.schema(
+                    [pyarrow.field(column, pyarrow.string()) for column in self.columns]
+                )
+        elif self.schema is not None:
+            schema = self.schema
+        elif self.schema_inference is not None:
+            schema = self.schema_inference.schema
+            if schema is None:
+                # infer the schema from the bulk item
+                sample = {}
+                for column in self.columns:
+                    values = columns.get(column, None)
+                    if values is None:
+                        sample[column] = pyarrow.nulls(num_rows)
+                    elif _is_arrow(values):
+                        sample[column] = values
+                    else:
+                        sample[column] = pyarrow.array(
+                            list(values)[: self.schema_inference.sample_items]
+                        )
+                schema = self.schema_inference.get_schema(sample)
+        else:  # auto determine schema
+            return pyarrow.table(columns)
+        arrays = []
+        for field in schema:
+            values = columns.get(field.name, None)
+            try:
+                if values is None:
+                    arrays.append(pyarrow.nulls(num_rows, field.type))
+                elif _is_arrow(values):
+                    arrays.append(values.cast(field.type, safe=self.safe))
+                else:
+                    arrays.append(
+                        pyarrow.array(values, type=field.type, safe=self.safe)
+                    )
+            except (
+                pyarrow.ArrowInvalid,
+                pyarrow.ArrowTypeError,
+                pyarrow.ArrowNotImplementedError,
+            ) as e:
+                raise RuntimeError(
+                    f"Error: Column {field.name} of the bulk item does not match the type {field.type}"
+                ) from e
+            if values is not None and _has_struct(field.type):
+                # pyarrow ignores fields that are not fields of the struct type
+                if _is_arrow(values):
+                    key = _find_unknown_struct_type_field(values.type, field.type)
+                else:
+                    key = _find_unknown_struct_field(values, field.type)
+                if key is not None:
+                    raise RuntimeError(
+                        f"Error: Column {field.name} of the bulk item contains the field {key}, which is not a field of the type {field.type}"
+                    )
+        try:
+            return pyarrow.Table.from_arrays(arrays, schema=schema)
+        except pyarrow.ArrowInvalid as e:
+            raise RuntimeError(
+                "Error: Columns of the bulk item have different lengths"
+            ) from e
+
+    def to_record_batches(self):
+        """
+        Convert the column buffers and bulk items to a list of pyarrow.RecordBatch. Usually, this is one record batch, but bulk items may not fit into one (e.g. if the offsets of a string column would overflow)
+        """
+        if len(self.tables) == 0:
+            return [self._to_record_batch()]
+        return self.to_table().to_batches()
+
+    def _to_record_batch(self):
+        """
+        Convert the column buffers to a pyarrow.RecordBatch
+        """
+        if self.convertstr == True:
+            return self._to_string_record_batch()
+        if self.schema is not None:
+            schema = self.schema
+        elif self.schema_inference is not None:
+            return self._to_inferred_record_batch()
+        else:  # auto determine schema
+            return pyarrow.RecordBatch.from_pydict(self.buffer)
+        arrays = [
+            self._to_array(
+                self.buffer.get(field.name, [None] * self.itemcount), field.type
+            )
+            for field in schema
+        ]
+        return pyarrow.RecordBatch.from_arrays(arrays, schema=schema)
+
+    def _to_array(self, values, arrow_type, convert=None):
+        """
+        Convert the buffer of a column to a pyarrow array of the given type
+        """
+        if isinstance(values, DictionaryBuffer):
+            return values.to_array(arrow_type, safe=self.safe, convert=convert)
+        if convert is not None:
+            values = [None if value is None else convert(value) for value in values]
+        return pyarrow.array(values, type=arrow_type, safe=self.safe)
+
+    def _to_string_record_batch(self):
+        """
+        Convert the column buffers to a pyarrow.RecordBatch with all values as strings
+        """
+        if self.schema is None:
+            return pyarrow.RecordBatch.from_arrays(
+                [to_string_array(values) for values in self.buffer.values()],
+                names=self.columns,
+            )
+        arrays = [
+            (
+                to_string_array(self.buffer[field.name]).cast(
+                    field.type, safe=self.safe
+                )
+                if field.name in self.buffer
+                else pyarrow.nulls(self.itemcount, field.type)
+            )
+            for field in self.schema
+        ]
+        return pyarrow.RecordBatch.from_arrays(arrays, schema=self.schema)
+
+    def _to_inferred_record_batch(self):
+        """
+        Convert the column buffers to a pyarrow.RecordBatch with the inferred schema
+        """
+        schema = self.schema_inference.get_schema(self.buffer)
+        arrays = []
+        for field in schema:
+            values = self.buffer.get(field.name, [None] * self.itemcount)
+            convert = None
+            if field.name in self.schema_inference.string_columns:
+                convert = str
+            try:
+                arrays.append(self._to_array(values, field.type, convert))
+            except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError) as e:
+                raise RuntimeError(
+                    f"Error: Values of column {field.name} do not match the inferred type {field.type}. Increase schema_inference_items or specify a schema"
+                ) from e
+            if field.name not in self.schema_inference.item_fields and _has_struct(
+                field.type
+            ):
+                key = _find_unknown_struct_field(values, field.type)
+                if key is not None:
+                    raise RuntimeError(
+                        f"Error: Values of column {field.name} contain the key {key}, which is not a field of the inferred type {field.type}. Increase schema_inference_items or specify a schema"
+                    )
+        return pyarrow.RecordBatch.from_arrays(arrays, schema=schema)
+
+    def to_table(self):
+        """
+        Convert the column buffers and bulk items to a pyarrow.Table
+        """
+        if len(self.tables) == 0:
+            return pyarrow.Table.from_batches([self._to_record_batch()])
+        self._convert_buffer()
+        table = pyarrow.concat_tables(self.tables, promote_options="permissive")
+        return table.select(self.columns).combine_chunks()
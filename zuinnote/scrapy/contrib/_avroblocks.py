@@ -0,0 +1,159 @@
+"""
+Copyright (c) 2026 ZuInnoTe (Jörn Franke) <oss@zuinnote.eu>
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+"""
+Internal Avro writer compressing blocks in parallel
+"""
+
+import collections
+import concurrent.futures
+import io
+
+from fastavro.io.binary_decoder import BinaryDecoder
+from fastavro.io.binary_encoder import BinaryEncoder
+from fastavro.write import Writer
+
+try:
+    # the block writers of the codecs are not part of the public API of fastavro
+    from fastavro._write_py import BLOCK_WRITERS
+except ImportError:
+    BLOCK_WRITERS = None
+
+
+def is_supported(codec):
+    """
+    Returns if blocks of the codec can be compressed in parallel. Otherwise, the fastavro writer should be used
+    """
+    return BLOCK_WRITERS is not None and codec in BLOCK_WRITERS
+
+
+class ParallelBlockWriter:
+    """
+    Writes an Avro container file. Records are encoded into uncompressed blocks, which
+    are compressed in a thread pool and written to the file in the order of the records.
+    The records are encoded by a fastavro writer without compression into a buffer
+    """
+
+    def __init__(
+        self,
+        fo,
+        schema,
+        codec="null",
+        sync_interval=16000,
+        metadata=None,
+        validator=None,
+        sync_marker=None,
+        compression_level=None,
+        threads=2,
+    ):
+        """
+        Initialize writer and write the header of the Avro file
+        """
+        # fastavro writes the header and validates the codec
+        header_writer = Writer(
+            fo,
+            schema,
+            codec=codec,
+            sync_interval=sync_interval,
+            metadata=metadata,
+            sync_marker=sync_marker,
+            compression_level=compression_level,
+        )
+        self.fo = fo
+        self.sync_marker = header_writer.sync_marker
+        self.block_writer = BLOCK_WRITERS[codec]
+        self.compression_level = compression_level
+        # the encoder writes uncompressed blocks into a buffer, its header is discarded
+        self.block = io.BytesIO()
+        self.encoder = Writer(
+            self.block,
+            schema,
+            codec="null",
+            sync_interval=sync_interval,
+            validator=validator,
+            sync_marker=self.sync_marker,
+        )
+        self.block.seek(0)
+        self.block.truncate()
+        self.threads = threads
+        self.max_pending_blocks = 2 * threads  # bounds memory of blocks to compress
+        self.pending_blocks = collections.deque()
+        self.executor = None
+
+    def write(self, record):
+        """
+        Encodes a record, the encoder writes a block to the buffer if it exceeds the sync interval
+        """
+        self.encoder.write(record)
+        if self.block.tell() > 0:
+            self._dump()
+
+    def flush(self):
+        """
+        Compresses the current block and writes all pending blocks to the file
+        """
+        self.encoder.flush()
+        if self.block.tell() > 0:
+            self._dump()
+        while self.pending_blocks:
+            self.fo.write(self.pending_blocks.popleft().result())
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+        self.fo.flush()
+
+    def _dump(self):
+        """
+        Hands over the block in the buffer for compression and writes completed blocks
+        """
+        if self.executor is None:
+            self.executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=self.threads, thread_name_prefix="AvroBlockCompression"
+            )
+        self.pending_blocks.append(
+            self.executor.submit(self._compress_block, self.block.getvalue())
+        )
+        self.block.seek(0)
+        self.block.truncate()
+        # write blocks in order, wait only if too many blocks are pending
+        while self.pending_blocks and (
+            self.pending_blocks[0].done()
+            or len(self.pending_blocks) > self.max_pending_blocks
+        ):
+            self.fo.write(self.pending_blocks.popleft().result())
+
+    def _compress_block(self, uncompressed_block):
+        """
+        Returns the compressed block including number of records, size and sync marker
+        """
+        # uncompressed block: number of records, size, records and sync marker
+        decoder = BinaryDecoder(io.BytesIO(uncompressed_block))
+        block_count = decoder.read_long()
+        block_size = decoder.read_long()
+        start = decoder.fo.tell()
+        block_bytes = uncompressed_block[start : start + block_size]
+        block = io.BytesIO()
+        encoder = BinaryEncoder(block)
+        encoder.write_long(block_count)
+        self.block_writer(encoder, block_bytes, self.compression_level)
+        block.write(self.sync_marker)
+        return block.getvalue()
@@ -0,0 +1,129 @@
+"""
+Copyright (c) 2026 ZuInnoTe (Jörn Franke) <oss@zuinnote.eu>
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+"""
+Internal extractor of the serialized values of items shared by the pyarrow based exporters (Parquet, Orc, Iceberg)
+"""
+
+from collections.abc import Mapping
+
+import scrapy
+from scrapy.exporters import BaseItemExporter
+
+
+class ItemFieldExtractor:
+    """
+    Extracts the serialized values of the columns from items. The same values are returned as by BaseItemExporter._get_serialized_fields(item, default_value="", include_empty=True), but the fields and serializers are determined only once per Item class
+    """
+
+    def __init__(self, exporter, columns):
+        """
+        Initialize extractor
+        """
+        self.exporter = exporter  # exporter with fields_to_export and serialize_field
+        self.columns = columns  # columns to extract in this order
+        self.extractors = {}  # compiled extractor per Item class
+
+    def extract(self, item):
+        """
+        Returns the serialized values of the columns of an item
+        """
+        extractor = self.extractors.get(type(item), None)
+        if extractor is None:
+            extractor = self._compile(item)
+            self.extractors[type(item)] = extractor
+        return extractor(item)
+
+    def _compile(self, item):
+        """
+        Creates the extractor for the class of an item
+        """
+        if type(self.exporter).serialize_field is not BaseItemExporter.serialize_field:
+            # a custom serialize_field may depend on the name of the field
+            return self._extract_serialized_fields
+        fields_to_export = self.exporter.fields_to_export
+        if type(item) is dict:
+            if fields_to_export is None:
+                # dicts have no serializers and missing columns are None
+                return self._extract_dict
+            return self._extract_serialized_fields
+        if not isinstance(item, scrapy.Item):
+            return self._extract_serialized_fields
+        # map the output fields to the fields of the item
+        if fields_to_export is None:
+            output_fields = {field: field for field in item.fields}
+        elif isinstance(fields_to_export, Mapping):
+            output_fields = {
+                output_field: field for field, output_field in fields_to_export.items()
+            }
+        else:
+            output_fields = {field: field for field in fields_to_export}
+        plan = []
+        for column in self.columns:
+            if column not in output_fields:
+                plan.append((None, None, None))
+                continue
+            field = output_fields[column]
+            serializer = item.fields.get(field, {}).get("serializer", None)
+            plan.append((field, serializer, ""))
+        if all(
+            field == column and serializer is None
+            for column, (field, serializer, _) in zip(self.columns, plan)
+        ):
+            columns = self.columns
+
+            def extract_item(item):
+                values = item._values
+                return [values.get(column, "") for column in columns]
+
+            return extract_item
+
+        def extract_serialized_item(item):
+            values = item._values
+            result = []
+            for field, serializer, default_value in plan:
+                if field not in values:
+                    result.append(default_value)
+                elif serializer is None:
+                    result.append(values[field])
+                else:
+                    result.append(serializer(values[field]))
+            return result
+
+        return extract_serialized_item
+
+    def _extract_dict(self, item):
+        """
+        Returns the values of the columns of a dict
+        """
+        return [item.get(column, None) for column in self.columns]
+
+    def _extract_serialized_fields(self, item):
+        """
+        Returns the values of the columns using the serialization of the exporter
+        """
+        fields = dict(
+            self.exporter._get_serialized_fields(
+                item, default_value="", include_empty=True
+            )
+        )
+        return [fields.get(column, None) for column in self.columns]
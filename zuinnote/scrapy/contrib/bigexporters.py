@@ -28,18 +28,40 @@ see: https://docs.scrapy.org/en/latest/topics/exporters.html
 from scrapy.exporters import BaseItemExporter
 from scrapy.utils.project import get_project_settings
 
+import collections
+import contextlib
+import hashlib
+import itertools
 import json
 import logging
-
-import pandas as pd
+import os
+import queue
+import re
+import tempfile
+import threading
+import time
+import urllib.parse
+import uuid
 
 SUPPORTED_EXPORTERS = {}
 ### Check which libraries are available for the exporters
 # Parquet
 try:
     import pyarrow
+    import pyarrow.compute as pc
+    import pyarrow.ipc
     import pyarrow.parquet as pq
+    from zuinnote.scrapy.contrib._arrowbatch import (
+        ArrowBatchBuilder,
+        ArrowSchemaInference,
+        decode_dictionaries,
+        decode_dictionary_schema,
+        get_item_fields,
+    )
+    from zuinnote.scrapy.contrib._extractor import ItemFieldExtractor
 
+    # pyarrow >= 25 places nulls per sort key
+    PYARROW_NULL_PLACEMENT_PER_KEY = int(pyarrow.__version__.split(".")[0]) >= 25
     SUPPORTED_EXPORTERS["parquet"] = True
     logging.getLogger().info(
         "Successfully imported pyarrow.parquet. Export to parquet supported."
@@ -50,15 +72,47 @@ except ImportError:
 try:
     import pyarrow
     import pyarrow.orc
+    from zuinnote.scrapy.contrib._arrowbatch import (
+        ArrowBatchBuilder,
+        ArrowSchemaInference,
+        decode_dictionaries,
+        decode_dictionary_schema,
+        get_item_fields,
+    )
+    from zuinnote.scrapy.contrib._extractor import ItemFieldExtractor
 
     SUPPORTED_EXPORTERS["orc"] = True
     logging.getLogger().info("Successfully imported pyarrow. Export to orc supported.")
 except ImportError:
     SUPPORTED_EXPORTERS["orc"] = False
+# Arrow IPC
+try:
+    import pyarrow
+    import pyarrow.ipc
+    from zuinnote.scrapy.contrib._arrowbatch import (
+        ArrowBatchBuilder,
+        ArrowSchemaInference,
+        decode_dictionaries,
+        get_item_fields,
+    )
+    from zuinnote.scrapy.contrib._extractor import ItemFieldExtractor
+
+    SUPPORTED_EXPORTERS["arrow"] = True
+    logging.getLogger().info(
+        "Successfully imported pyarrow.ipc. Export to arrow supported."
+    )
+except ImportError:
+    SUPPORTED_EXPORTERS["arrow"] = False
 
 # Avro
 try:
-    from fastavro import writer as fa_writer, parse_schema as fa_parse_schema
+    from fastavro import parse_schema as fa_parse_schema
+    from fastavro.write import Writer as fa_Writer
+    from zuinnote.scrapy.contrib._avroblocks import (
+        ParallelBlockWriter,
+        is_supported as avro_parallel_supported,
+    )
+    from zuinnote.scrapy.contrib._estimate import estimate_size
 
     SUPPORTED_EXPORTERS["avro"] = True
     logging.getLogger().info(
@@ -72,6 +126,24 @@ try:
     import pyarrow
     import pyiceberg
     from pyiceberg.catalog import load_catalog
+    from pyiceberg.exceptions import (
+        CommitFailedException,
+        NoSuchTableError,
+        TableAlreadyExistsError,
+    )
+    from pyiceberg.expressions import AlwaysTrue
+    from pyiceberg.io.pyarrow import ArrowScan, _dataframe_to_data_files
+    from pyiceberg.manifest import ManifestContent
+    from pyiceberg.table import FileScanTask
+    from pyiceberg.transforms import parse_transform
+    from zuinnote.scrapy.contrib._arrowbatch import (
+        ArrowBatchBuilder,
+        ArrowSchemaInference,
+        decode_dictionaries,
+        decode_dictionary_schema,
+        get_item_fields,
+    )
+    from zuinnote.scrapy.contrib._extractor import ItemFieldExtractor
 
     SUPPORTED_EXPORTERS["iceberg"] = True
     logging.getLogger().info(
@@ -81,6 +153,40 @@ except ImportError:
     SUPPORTED_EXPORTERS["iceberg"] = False
 
 
+class ArrowBulkItem:
+    """
+    Item with many rows for the pyarrow based exporters (Parquet, Orc, Iceberg). The rows are appended to the buffer of the exporter as a whole instead of one item at a time
+    """
+
+    def __init__(self, data):
+        """
+        Initialize bulk item with a pyarrow.RecordBatch, pyarrow.Table or dict of lists (column: values)
+        """
+        # pyarrow.RecordBatch and pyarrow.Table have a schema
+        if not isinstance(data, dict) and not hasattr(data, "schema"):
+            raise RuntimeError(
+                "Error: Data of a bulk item must be a pyarrow.RecordBatch, pyarrow.Table or dict of lists"
+            )
+        self.data = data
+
+    def __len__(self):
+        """
+        Number of rows
+        """
+        if isinstance(self.data, dict):
+            return len(next(iter(self.data.values()), []))
+        return self.data.num_rows
+
+    @property
+    def columns(self):
+        """
+        Names of the columns
+        """
+        if isinstance(self.data, dict):
+            return list(self.data.keys())
+        return self.data.schema.names
+
+
 """
 Parquet exporter
 Write export as parquet file
@@ -115,6 +221,25 @@ class ParquetItemExporter(BaseItemExporter):
         ## exporter
         self.pq_convertstr = options.pop("convertallstrings", False)
         self.pq_no_items_batch = options.pop("no_items_batch", 10000)
+        self.pq_max_buffer_bytes = options.pop("max_buffer_bytes", None)
+        self.pq_schema_inference_items = options.pop("schema_inference_items", 10000)
+        self.pq_dictionary_columns = options.pop("dictionary_columns", None)
+        self.pq_dictionary_max_cardinality = options.pop(
+            "dictionary_max_cardinality", 0.1
+        )
+        self.pq_async_write = options.pop("async_write", False)
+        self.pq_async_queue_size = options.pop("async_queue_size", 1)
+        self.pq_rolling_max_bytes = options.pop("rolling_max_bytes", None)
+        self.pq_rolling_max_rows = options.pop("rolling_max_rows", None)
+        self.pq_rolling_path = options.pop(
+            "rolling_path", "{name}-part-{part:05d}.parquet"
+        )
+        self.pq_partition_cols = options.pop("partition_cols", None)
+        self.pq_partition_max_open_files = options.pop("partition_max_open_files", 64)
+        self.pq_global_sort = options.pop("global_sort", False)
+        self.pq_spill_directory = options.pop("spill_directory", None)
+        self.pq_spill_chunk_rows = options.pop("spill_chunk_rows", None)
+        self.pq_spill_fan_in = options.pop("spill_fan_in", 16)
         ## parquet
         self.pq_pyarrow_safe_schema = options.pop("pyarrow_safe_schema", True)
         self.pq_schema = options.pop("schema", None)
@@ -155,8 +280,43 @@ class ParquetItemExporter(BaseItemExporter):
         self.pq_use_content_defined_chunking = options.pop(
             "use_content_defined_chunking", False
         )
+        # Validate settings
+        if self.pq_global_sort and not self.pq_sorting_columns:
+            raise RuntimeError("Error: Option global_sort requires sorting_columns")
+        if self.pq_spill_fan_in < 2:
+            raise RuntimeError("Error: Option spill_fan_in cannot be smaller than 2")
+        if (
+            SUPPORTED_EXPORTERS["parquet"]
+            and not PYARROW_NULL_PLACEMENT_PER_KEY
+            and len({column.nulls_first for column in self.pq_sorting_columns or []})
+            > 1
+        ):
+            raise RuntimeError(
+                "Error: Sorting columns with different nulls_first require pyarrow 25+"
+            )
+        if self.pq_partition_max_open_files < 1:
+            raise RuntimeError(
+                "Error: Option partition_max_open_files cannot be smaller than 1"
+            )
         # Init writer
         self.writer = None
+        self.writer_thread = None
+        self.writer_queue = None
+        self.writer_exception = None
+        # Init part files
+        self.pq_write_parts = (
+            self.pq_rolling_max_bytes is not None
+            or self.pq_rolling_max_rows is not None
+            or self.pq_partition_cols is not None
+        )
+        self.totalitemcount = 0
+        # open part files, number of part files and rows of the open part file per partition directory
+        self.part_writers = collections.OrderedDict()
+        self.part_counts = {}
+        self.part_rows = {}
+        self.part_files = []
+        # Init sorted runs spilled to disk (only global sort)
+        self.spill_runs = []
 
     def export_item(self, item):
         """
@@ -166,13 +326,22 @@ class ParquetItemExporter(BaseItemExporter):
         if len(self.columns) == 0:
             self._init_table(item)
         # Create a new row group to write
-        if self.itemcount > self.pq_no_items_batch:
+        if self.itemcount > self.pq_no_items_batch and not self.batch.schema_pending:
+            self._flush_table()
+        # Add the item to the column buffers
+        if isinstance(item, ArrowBulkItem):
+            self.batch.append_bulk(item.data)
+            self.itemcount += len(item)
+        else:
+            self._append_item(item)
+            self.itemcount += 1
+        # Flush if the buffer exceeds the memory budget
+        if (
+            self.pq_max_buffer_bytes is not None
+            and self.batch.nbytes >= self.pq_max_buffer_bytes
+            and not self.batch.schema_pending
+        ):
             self._flush_table()
-        # Add the item to data frame
-        self.df = pd.concat(
-            [self.df if not self.df.empty else None, self._get_df_from_item(item)]
-        )
-        self.itemcount += 1
         return item
 
     def start_exporting(self):
@@ -188,15 +357,43 @@ class ParquetItemExporter(BaseItemExporter):
         """
         Triggered when Scrapy ends exporting. Useful to shutdown threads, close files etc.
         """
-        self._flush_table()
+        try:
+            self._flush_table()
+            if self.writer_thread is not None:
+                # wait until all row groups are written
+                self.writer_queue.put(None)
+                self.writer_thread.join()
+                self.writer_thread = None
+            if self.pq_global_sort and self.writer_exception is None:
+                self._merge_runs()
+        finally:
+            # remove sorted runs also if the export failed
+            self._remove_runs()
         if self.writer is not None:
             self.writer.close()
+            self.writer = None
+        while len(self.part_writers) > 0:
+            self._close_part_file(next(iter(self.part_writers)))
+        self._raise_writer_exception()
+        if self.pq_write_parts:
+            # write json with number of items scraped and the part files
+            self.file.write(
+                bytearray(
+                    json.dumps(
+                        {"noitems": self.totalitemcount, "files": self.part_files}
+                    ),
+                    "utf-8",
+                )
+            )
 
     def _get_columns(self, item):
         """
         Determines the columns of an item
         """
-        if isinstance(item, dict):
+        if isinstance(item, ArrowBulkItem):
+            # use columns of the bulk item
+            self.columns = item.columns
+        elif isinstance(item, dict):
             # for dicts try using fields of the first item
             self.columns = list(item.keys())
         else:
@@ -209,87 +406,490 @@ class ParquetItemExporter(BaseItemExporter):
         """
         # initialize columns
         self._get_columns(item)
-        self._reset_dataframe()
+        for column in self.pq_partition_cols or []:
+            if column not in self.columns:
+                raise RuntimeError(
+                    f"Error: Partition column {column} is not a field of the item"
+                )
+        # use the types declared in the item fields and infer the others once from the first items
+        item_fields = get_item_fields(item, self.columns)
+        self.schema_inference = None
+        if (
+            self.pq_schema_inference_items is not None
+            or len(item_fields) > 0
+            or self.pq_dictionary_columns is not None
+        ):
+            self.schema_inference = ArrowSchemaInference(
+                self.pq_schema_inference_items,
+                item_fields,
+                self.pq_dictionary_columns,
+                self.pq_dictionary_max_cardinality,
+            )
+        self.extractor = ItemFieldExtractor(self, self.columns)
+        self.batch = self._new_batch()
 
-    def _get_df_from_item(self, item):
+    def _new_batch(self):
         """
-        Get the dataframe from item
+        Creates new column buffers
         """
-        row = {}
-        fields = dict(
-            self._get_serialized_fields(item, default_value="", include_empty=True)
+        return ArrowBatchBuilder(
+            self.columns,
+            schema=self.pq_schema,
+            safe=self.pq_pyarrow_safe_schema,
+            convertallstrings=self.pq_convertstr,
+            estimate_nbytes=self.pq_max_buffer_bytes is not None,
+            schema_inference=self.schema_inference,
         )
-        for column in self.columns:
-            if self.pq_convertstr == True:
-                row[column] = str(fields.get(column, None))
-            else:
-                value = fields.get(column, None)
-                row[column] = value
-        if self.pq_convertstr == True:
-            return pd.DataFrame(row, index=[0]).astype(str)
-        return pd.DataFrame.from_dict([row])
 
-    def _reset_dataframe(self):
+    def _append_item(self, item):
         """
-        Reset dataframe for writing
+        Append the values of an item to the column buffers
         """
-        if self.pq_convertstr == False:  # auto determine schema
-            # initialize df
-            self.df = pd.DataFrame(columns=self.columns)
-        else:
-            # initialize df with zero strings to derive correct schema
-            self.df = pd.DataFrame(columns=self.columns).astype(str)
+        self.batch.append_values(self.extractor.extract(item))
 
     def _flush_table(self):
         """
         Writes the current row group to parquet file
         """
-        if len(self.df.index) > 0:
+        if self.itemcount > 0:
             # reset written entries
+            self.totalitemcount += self.itemcount
             self.itemcount = 0
-            # write existing dataframe to parquet file
-            if self.pq_schema is not None:
-                table = pyarrow.Table.from_pandas(
-                    self.df, schema=self.pq_schema, safe=pq_pyarrow_safe_schema
-                )
+            if self.pq_async_write:
+                # hand over full buffers to writer thread and continue with new ones
+                self._raise_writer_exception()
+                if self.writer_thread is None:
+                    self._start_writer_thread()
+                self.writer_queue.put(self.batch)
+                self.batch = self._new_batch()
+            else:
+                self._write_batch(self.batch)
+                # initialize new column buffers for new row group
+                self.batch.reset()
+
+    def _start_writer_thread(self):
+        """
+        Starts the thread writing row groups in the background
+        """
+        self.writer_queue = queue.Queue(maxsize=self.pq_async_queue_size)
+        self.writer_thread = threading.Thread(
+            target=self._write_batches, name="ParquetItemExporterWriter", daemon=True
+        )
+        self.writer_thread.start()
+
+    def _write_batches(self):
+        """
+        Writes row groups handed over by the exporter until it receives None
+        """
+        while True:
+            batch = self.writer_queue.get()
+            if batch is None:
+                return
+            # discard remaining row groups after an error so that the exporter does not block
+            if self.writer_exception is None:
+                try:
+                    self._write_batch(batch)
+                except Exception as e:
+                    self.writer_exception = e
+
+    def _raise_writer_exception(self):
+        """
+        Raises an exception that occurred in the writer thread
+        """
+        if self.writer_exception is not None:
+            raise RuntimeError(
+                "Error: Cannot write row group to parquet file"
+            ) from self.writer_exception
+
+    def _write_batch(self, builder):
+        """
+        Converts column buffers to record batches and writes them as row groups
+        """
+        for batch in builder.to_record_batches():
+            if self.pq_global_sort:
+                self._spill_run(batch)
             else:
-                table = pyarrow.Table.from_pandas(self.df)
-            if self.writer is None:
-                if self.pq_schema is None:
-                    schema = table.schema
+                self._write_record_batch(batch)
+
+    def _spill_run(self, batch):
+        """
+        Sorts a record batch and writes it as sorted run to a temporary Arrow IPC stream
+        """
+        if batch.num_rows == 0:
+            return
+        batch = self._sort_batch(batch)
+        with self._new_run_writer(batch.schema) as run_writer:
+            run_writer.write_table(
+                pyarrow.Table.from_batches([batch]),
+                max_chunksize=self._get_spill_chunk_rows(batch),
+            )
+
+    def _new_run_writer(self, schema):
+        """
+        Creates a temporary Arrow IPC stream for a sorted run. The stream format allows different dictionaries per chunk
+        """
+        fd, path = tempfile.mkstemp(suffix=".arrows", dir=self.pq_spill_directory)
+        os.close(fd)
+        self.spill_runs.append(path)
+        return pyarrow.ipc.new_stream(path, schema)
+
+    def _get_spill_chunk_rows(self, data):
+        """
+        Returns the number of rows of the chunks of a sorted run. While merging, up to two chunks of each of at most spill_fan_in runs are in memory. Thus, a chunk is half of the buffer size divided by the fan-in
+        """
+        if self.pq_spill_chunk_rows is not None:
+            return self.pq_spill_chunk_rows
+        rows = self.pq_no_items_batch
+        if self.pq_max_buffer_bytes is not None and data.nbytes > 0:
+            rows = min(
+                rows, int(self.pq_max_buffer_bytes * data.num_rows / data.nbytes)
+            )
+        return max(1, rows // (2 * self.pq_spill_fan_in))
+
+    def _merge_runs(self):
+        """
+        Merges the sorted runs and writes the globally sorted rows. If there are more than spill_fan_in runs then groups of spill_fan_in runs are merged into new runs first (multi-pass k-way merge).
+        Thus, only up to two chunks of at most spill_fan_in runs are in memory and each row is merged a logarithmic number of times
+        """
+        runs = list(self.spill_runs)
+        while len(runs) > self.pq_spill_fan_in:
+            runs = [
+                path
+                for path in (
+                    self._merge_into_run(runs[start : start + self.pq_spill_fan_in])
+                    for start in range(0, len(runs), self.pq_spill_fan_in)
+                )
+                if path is not None
+            ]
+        merged = []
+        merged_rows = 0
+        with contextlib.closing(self._merge_sorted_runs(runs)) as tables:
+            for table in tables:
+                merged.append(table)
+                merged_rows += table.num_rows
+                if merged_rows >= self.pq_no_items_batch:
+                    self._write_merged_rows(merged)
+                    merged = []
+                    merged_rows = 0
+        self._write_merged_rows(merged)
+
+    def _merge_into_run(self, paths):
+        """
+        Merges sorted runs into a new sorted run, removes the merged runs and returns the path of the new run
+        """
+        if len(paths) == 1:
+            return paths[0]
+        path = None
+        run_writer = None
+        try:
+            with contextlib.closing(self._merge_sorted_runs(paths)) as tables:
+                for table in tables:
+                    if run_writer is None:
+                        run_writer = self._new_run_writer(table.schema)
+                        path = self.spill_runs[-1]
+                        chunk_rows = self._get_spill_chunk_rows(table)
+                    run_writer.write_table(table, max_chunksize=chunk_rows)
+        finally:
+            if run_writer is not None:
+                run_writer.close()
+        # the merged runs are not needed anymore
+        for merged_path in paths:
+            os.remove(merged_path)
+            self.spill_runs.remove(merged_path)
+        return path
+
+    def _merge_sorted_runs(self, paths):
+        """
+        Merges sorted runs and returns the merged rows as tables in sort order. Each run that has less than a chunk in memory is refilled with its next chunk.
+        Thus, at most two chunks per run are kept in memory and the rows of all runs are merged in few rounds
+        """
+        with contextlib.ExitStack() as stack:
+            readers = [
+                pyarrow.ipc.open_stream(stack.enter_context(pyarrow.OSFile(path)))
+                for path in paths
+            ]
+            # rows of all runs have the same schema so that they can be merged, e.g. null columns of a run have the type of the other runs
+            schema = pyarrow.unify_schemas(
+                [reader.schema for reader in readers], promote_options="permissive"
+            )
+            pending = [schema.empty_table() for _ in readers]
+            chunk_rows = [None] * len(readers)
+            exhausted = [False] * len(readers)
+            while True:
+                for run, reader in enumerate(readers):
+                    while not exhausted[run] and (
+                        chunk_rows[run] is None
+                        or pending[run].num_rows < chunk_rows[run]
+                    ):
+                        try:
+                            chunk = reader.read_next_batch()
+                        except StopIteration:
+                            exhausted[run] = True
+                            break
+                        if not chunk.schema.equals(schema):
+                            chunk = chunk.cast(schema)
+                        if chunk_rows[run] is None:
+                            chunk_rows[run] = max(1, chunk.num_rows)
+                        pending[run] = pyarrow.concat_tables(
+                            [pending[run], pyarrow.Table.from_batches([chunk])]
+                        )
+                runs = [run for run in range(len(readers)) if pending[run].num_rows > 0]
+                if len(runs) == 0:
+                    return
+                table = pyarrow.concat_tables([pending[run] for run in runs])
+                indices = self._sort_indices(table)
+                # rows up to the smallest last row of runs with remaining chunks are smaller than all rows not read yet
+                last_rows = []
+                offset = 0
+                for run in runs:
+                    offset += pending[run].num_rows
+                    if not exhausted[run]:
+                        last_rows.append(offset - 1)
+                if len(last_rows) == 0:
+                    bound = len(indices) - 1
                 else:
-                    schema = self.pq_schema
-                self.writer = pq.ParquetWriter(
-                    self.file.name,
-                    schema=schema,
-                    version=self.pq_version,
-                    use_dictionary=self.pq_use_dictionary,
-                    compression=self.pq_compression,
-                    write_statistics=self.pq_write_statistics,
-                    use_deprecated_int96_timestamps=self.pq_use_deprecated_int96_timestamps,
-                    coerce_timestamps=self.pq_coerce_timestamps,
-                    allow_truncated_timestamps=self.pq_allow_truncated_timestamps,
-                    data_page_size=self.pq_data_page_size,
-                    flavor=self.pq_flavor,
-                    filesystem=self.pq_filesystem,
-                    compression_level=self.pq_compression_level,
-                    use_byte_stream_split=self.pq_use_byte_stream_split,
-                    column_encoding=self.pq_column_encoding,
-                    data_page_version=self.pq_data_page_version,
-                    use_compliant_nested_type=self.pq_use_compliant_nested_type,
-                    encryption_properties=self.pq_encryption_properties,
-                    write_batch_size=self.pq_write_batch_size,
-                    dictionary_pagesize_limit=self.pq_dictionary_pagesize_limit,
-                    store_schema=self.pq_store_schema,
-                    write_page_index=self.pq_write_page_index,
-                    write_page_checksum=self.pq_write_page_checksum,
-                    sorting_columns=self.pq_sorting_columns,
-                    store_decimal_as_integer=self.pq_store_decimal_as_integer,
-                    use_content_defined_chunking=self.pq_use_content_defined_chunking,
+                    bound = pc.min(
+                        pc.index_in(pyarrow.array(last_rows), value_set=indices)
+                    ).as_py()
+                indices = indices.slice(0, bound + 1)
+                # run of each row, kept separately so that it cannot collide with the fields of the items
+                run_ids = pyarrow.concat_arrays(
+                    [
+                        pyarrow.repeat(
+                            pyarrow.scalar(run, pyarrow.int32()), pending[run].num_rows
+                        )
+                        for run in runs
+                    ]
+                )
+                # the sort is stable. Thus, the merged rows of each run are its first pending rows
+                for count in pc.value_counts(run_ids.take(indices)).to_pylist():
+                    pending[count["values"]] = pending[count["values"]].slice(
+                        count["counts"]
+                    )
+                yield table.take(indices)
+
+    def _remove_runs(self):
+        """
+        Removes the sorted runs spilled to disk
+        """
+        for path in self.spill_runs:
+            if os.path.exists(path):
+                os.remove(path)
+        self.spill_runs = []
+
+    def _write_merged_rows(self, merged):
+        """
+        Writes merged rows as one row group
+        """
+        if len(merged) > 0:
+            for batch in (
+                pyarrow.concat_tables(merged, promote_options="default")
+                .combine_chunks()
+                .to_batches()
+            ):
+                # merged rows are already sorted
+                self._write_record_batch(batch, sort=False)
+
+    def _write_record_batch(self, batch, sort=True):
+        """
+        Writes a record batch as row group to the parquet file, part files or partitions. The record batch is sorted by the sorting columns unless sort is False
+        """
+        if self.pq_schema is None:
+            schema = batch.schema
+        else:
+            schema = self.pq_schema
+        # sort all columns before the partition columns are removed
+        if sort:
+            batch = self._sort_batch(batch)
+        if self.pq_partition_cols is not None:
+            part_schema = pyarrow.schema(
+                [field for field in schema if field.name not in self.pq_partition_cols]
+            )
+            sorting_columns = self._get_part_sorting_columns(schema, part_schema)
+            for directory, partition_batch in self._split_partitions(batch):
+                self._write_part_batch(
+                    partition_batch, part_schema, directory, sorting_columns
                 )
-            self.writer.write_table(table, self.pq_row_group_size)
-            # initialize new data frame for new row group
-            self._reset_dataframe()
+            return
+        if self.pq_write_parts:
+            self._write_part_batch(batch, schema, "", self.pq_sorting_columns)
+            return
+        if self.writer is None:
+            self.writer = self._new_writer(self.file.name, schema)
+        self.writer.write_batch(batch, self.pq_row_group_size)
+
+    def _sort_batch(self, batch):
+        """
+        Sorts a record batch or table by the sorting columns so that the data has the order declared in the Parquet metadata
+        """
+        if not self.pq_sorting_columns:
+            return batch
+        return batch.take(self._sort_indices(batch))
+
+    def _sort_indices(self, data):
+        """
+        Returns the indices that sort a record batch or table by the sorting columns
+        """
+        sort_keys = self._get_sort_keys(data.schema)
+        # pyarrow cannot sort tables by dictionary columns
+        data = decode_dictionaries(data.select([name for name, _, _ in sort_keys]))
+        if PYARROW_NULL_PLACEMENT_PER_KEY:
+            return pc.sort_indices(data, sort_keys=sort_keys)
+        # older pyarrow versions have one null placement for all sort keys (validated when configuring)
+        sort_keys, null_placement = pq.SortingColumn.to_ordering(
+            data.schema, self.pq_sorting_columns
+        )
+        return pc.sort_indices(data, sort_keys=sort_keys, null_placement=null_placement)
+
+    def _get_sort_keys(self, schema):
+        """
+        Returns the sort keys (name, order, null placement) of the sorting columns. The sorting columns refer to the columns of the items including partition columns
+        """
+        sort_keys = []
+        for sorting_column in self.pq_sorting_columns:
+            # resolve each sorting column separately, pyarrow rejects different null placements in one call
+            ((name, order),), null_placement = pq.SortingColumn.to_ordering(
+                schema, [sorting_column]
+            )
+            sort_keys.append((name, order, null_placement))
+        return sort_keys
+
+    def _get_part_sorting_columns(self, schema, part_schema):
+        """
+        Returns the sorting columns of the part files of partitions, which do not contain the partition columns.
+        A partition column has one value per part file. Thus, it is removed and the rows are still sorted by the other sorting columns
+        """
+        if not self.pq_sorting_columns:
+            return self.pq_sorting_columns
+        return tuple(
+            pq.SortingColumn.from_ordering(
+                part_schema, [(name, order)], null_placement
+            )[0]
+            for name, order, null_placement in self._get_sort_keys(schema)
+            if name not in self.pq_partition_cols
+        )
+
+    def _split_partitions(self, batch):
+        """
+        Splits a record batch into the rows of each partition. Returns the Hive-style partition directory (e.g. domain=example.com/date=2026-10-18) and the rows without partition columns
+        """
+        rows = {}
+        for index, key in enumerate(
+            zip(
+                *[batch.column(column).to_pylist() for column in self.pq_partition_cols]
+            )
+        ):
+            rows.setdefault(key, []).append(index)
+        data = batch.select(
+            [name for name in batch.schema.names if name not in self.pq_partition_cols]
+        )
+        for key, indices in rows.items():
+            directory = os.path.join(
+                *[
+                    f"{column}={self._get_partition_value(value)}"
+                    for column, value in zip(self.pq_partition_cols, key)
+                ]
+            )
+            yield directory, data.take(pyarrow.array(indices))
+
+    def _get_partition_value(self, value):
+        """
+        Returns the escaped value of a partition column for the partition directory
+        """
+        if value is None or value == "":
+            return "__HIVE_DEFAULT_PARTITION__"
+        return urllib.parse.quote(str(value), safe="")
+
+    def _write_part_batch(self, batch, schema, directory, sorting_columns):
+        """
+        Writes a sorted record batch to the open part file of a partition directory. The part file is closed once it reaches the maximum number of rows or bytes
+        """
+        offset = 0
+        while offset < batch.num_rows:
+            writer = self.part_writers.get(directory, None)
+            if writer is None:
+                writer = self._open_part_file(schema, directory, sorting_columns)
+            else:
+                self.part_writers.move_to_end(directory)
+            length = batch.num_rows - offset
+            if self.pq_rolling_max_rows is not None:
+                length = min(
+                    length, self.pq_rolling_max_rows - self.part_rows[directory]
+                )
+            writer.write_batch(batch.slice(offset, length), self.pq_row_group_size)
+            offset += length
+            self.part_rows[directory] += length
+            if (
+                self.pq_rolling_max_rows is not None
+                and self.part_rows[directory] >= self.pq_rolling_max_rows
+            ) or (
+                self.pq_rolling_max_bytes is not None
+                and writer.file_handle.tell() >= self.pq_rolling_max_bytes
+            ):
+                self._close_part_file(directory)
+
+    def _open_part_file(self, schema, directory, sorting_columns):
+        """
+        Opens the next part file of a partition directory relative to the directory of the exported file. If too many part files are open then the least recently used one is closed
+        """
+        if len(self.part_writers) >= self.pq_partition_max_open_files:
+            self._close_part_file(next(iter(self.part_writers)))
+        part = self.part_counts.get(directory, 0) + 1
+        self.part_counts[directory] = part
+        name = os.path.splitext(os.path.basename(self.file.name))[0]
+        path = os.path.join(
+            os.path.dirname(self.file.name),
+            self.pq_rolling_path.format(name=name, part=part),
+        )
+        path = os.path.join(os.path.dirname(path), directory, os.path.basename(path))
+        if self.pq_filesystem is None and os.path.dirname(path) != "":
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        writer = self._new_writer(path, schema, sorting_columns)
+        self.part_writers[directory] = writer
+        self.part_rows[directory] = 0
+        self.part_files.append(path)
+        return writer
+
+    def _close_part_file(self, directory):
+        """
+        Closes the open part file of a partition directory. A closed part file is complete and can be read
+        """
+        self.part_writers.pop(directory).close()
+
+    def _new_writer(self, where, schema, sorting_columns=None):
+        """
+        Creates a Parquet writer with the configured options writing to a file name or stream. The sorting columns of part files of partitions differ from the configured ones
+        """
+        if sorting_columns is None:
+            sorting_columns = self.pq_sorting_columns
+        return pq.ParquetWriter(
+            where,
+            schema=schema,
+            version=self.pq_version,
+            use_dictionary=self.pq_use_dictionary,
+            compression=self.pq_compression,
+            write_statistics=self.pq_write_statistics,
+            use_deprecated_int96_timestamps=self.pq_use_deprecated_int96_timestamps,
+            coerce_timestamps=self.pq_coerce_timestamps,
+            allow_truncated_timestamps=self.pq_allow_truncated_timestamps,
+            data_page_size=self.pq_data_page_size,
+            flavor=self.pq_flavor,
+            filesystem=self.pq_filesystem,
+            compression_level=self.pq_compression_level,
+            use_byte_stream_split=self.pq_use_byte_stream_split,
+            column_encoding=self.pq_column_encoding,
+            data_page_version=self.pq_data_page_version,
+            use_compliant_nested_type=self.pq_use_compliant_nested_type,
+            encryption_properties=self.pq_encryption_properties,
+            write_batch_size=self.pq_write_batch_size,
+            dictionary_pagesize_limit=self.pq_dictionary_pagesize_limit,
+            store_schema=self.pq_store_schema,
+            write_page_index=self.pq_write_page_index,
+            write_page_checksum=self.pq_write_page_checksum,
+            sorting_columns=sorting_columns,
+            store_decimal_as_integer=self.pq_store_decimal_as_integer,
+            use_content_defined_chunking=self.pq_use_content_defined_chunking,
+        )
 
 
 """
@@ -298,6 +898,73 @@ Write export as avro file
 """
 
 
+class AvroSchemaCache:
+    """
+    Process-wide cache of parsed avro schemas shared by all AvroItemExporter instances
+    """
+
+    def __init__(self, maxsize=128):
+        """
+        Initialize cache
+        """
+        self.maxsize = maxsize  # maximum number of parsed schemas
+        self.schemas = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def get(self, schema):
+        """
+        Returns the parsed schema. The schema is only parsed if it is not in the cache
+        """
+        key = self._get_key(schema)
+        with self.lock:
+            parsed_schema = self.schemas.get(key)
+            if parsed_schema is not None:
+                self.hits += 1
+                self.schemas.move_to_end(key)
+                return parsed_schema
+            self.misses += 1
+        parsed_schema = fa_parse_schema(schema)
+        with self.lock:
+            self.schemas[key] = parsed_schema
+            # remove least recently used schemas
+            while len(self.schemas) > self.maxsize:
+                self.schemas.popitem(last=False)
+        return parsed_schema
+
+    def info(self):
+        """
+        Returns statistics of the cache
+        """
+        with self.lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self.schemas),
+                "maxsize": self.maxsize,
+            }
+
+    def clear(self):
+        """
+        Removes all schemas and statistics from the cache
+        """
+        with self.lock:
+            self.schemas.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def _get_key(self, schema):
+        """
+        Returns a hash of the canonical JSON representation of the schema
+        """
+        canonical_schema = json.dumps(schema, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(canonical_schema.encode("utf-8")).hexdigest()
+
+
+AVRO_SCHEMA_CACHE = AvroSchemaCache()
+
+
 class AvroItemExporter(BaseItemExporter):
     """
     Avro exporter
@@ -308,10 +975,10 @@ class AvroItemExporter(BaseItemExporter):
         Initialize exporter
         """
         super().__init__(**kwargs)
-        self.firstBlock = True
         self.file = file  # file name
         self.itemcount = 0  # initial item count
         self.records = []  # record cache
+        self.recordbytes = 0  # estimated bytes in record cache
         self.logger = logging.getLogger()
         self._configure(kwargs, dont_fail=dont_fail)
 
@@ -326,6 +993,7 @@ class AvroItemExporter(BaseItemExporter):
         # Read settings
         self.avro_compression = options.pop("compression", "deflate")
         self.avro_compressionlevel = options.pop("compressionlevel", None)
+        self.avro_compressionthreads = options.pop("compressionthreads", None)
         self.avro_convertstr = options.pop("convertallstrings", False)
         self.avro_schema = options.pop("avroschema", "")
         if self.avro_schema == "":
@@ -335,20 +1003,33 @@ class AvroItemExporter(BaseItemExporter):
         self.avro_syncinterval = options.pop("syncinterval", 16000)
         self.avro_syncmarker = options.pop("syncmarker", None)
         self.avro_recordcache = options.pop("recordcache", 10000)
+        self.avro_max_buffer_bytes = options.pop("max_buffer_bytes", None)
+        self.avro_streaming = options.pop("streaming", False)
         self.avro_metadata = options.pop("metadata")
+        # Init writer
+        self.avro_writer = None
 
     def export_item(self, item):
         """
         Export a specific item to the file
         """
         if self.avro_parsedschema is None:
-            self.avro_parsedschema = fa_parse_schema(self.avro_schema)
+            self.avro_parsedschema = AVRO_SCHEMA_CACHE.get(self.avro_schema)
+        if self.avro_streaming:
+            # encode record directly into the current block
+            self._get_writer().write(self._get_dict_from_item(item))
+            return item
         # flush cache to avro file
         if self.itemcount > self.avro_recordcache:
             self._flush_table()
         record = self._get_dict_from_item(item)
         self.records.append(record)
         self.itemcount += 1
+        # Flush if the record cache exceeds the memory budget
+        if self.avro_max_buffer_bytes is not None:
+            self.recordbytes += estimate_size(record)
+            if self.recordbytes >= self.avro_max_buffer_bytes:
+                self._flush_table()
         return item
 
     def start_exporting(self):
@@ -366,6 +1047,9 @@ class AvroItemExporter(BaseItemExporter):
         """
         # flush last items from records cache
         self._flush_table()
+        # write last block
+        if self.avro_writer is not None:
+            self.avro_writer.flush()
         # close any open file
         self.file.close()
 
@@ -374,28 +1058,53 @@ class AvroItemExporter(BaseItemExporter):
         Writes the current record cache to avro file
         """
         if len(self.records) > 0:
-            if self.firstBlock == False:
-                # reopen file
-                self.file.close()
-                self.file = open(self.file.name, "a+b")
-            # write cache to avro file
-            fa_writer(
-                self.file,
-                self.avro_parsedschema,
-                self.records,
-                codec=self.avro_compression,
-                sync_interval=self.avro_syncinterval,
-                metadata=self.avro_metadata,
-                validator=self.avro_validator,
-                sync_marker=self.avro_syncmarker,
-                codec_compression_level=self.avro_compressionlevel,
-            )
+            writer = self._get_writer()
+            # write cache to avro file, blocks are written based on the sync interval
+            for record in self.records:
+                writer.write(record)
             # reset written entries
             self.itemcount = 0
             # initialize new record cache
             self.records = []
-            # reinit file
-            self.firstBlock = False
+            self.recordbytes = 0
+
+    def _get_writer(self):
+        """
+        Returns the avro writer, which is kept open until the export is finished
+        """
+        if self.avro_writer is None:
+            if self.avro_compressionthreads and not avro_parallel_supported(
+                self.avro_compression
+            ):
+                logging.getLogger().warning(
+                    f"Avro: Blocks of codec {self.avro_compression} cannot be compressed in parallel with this fastavro version. Ignoring option compressionthreads"
+                )
+                self.avro_compressionthreads = None
+            if self.avro_compressionthreads:
+                # compress blocks in parallel
+                self.avro_writer = ParallelBlockWriter(
+                    self.file,
+                    self.avro_parsedschema,
+                    codec=self.avro_compression,
+                    sync_interval=self.avro_syncinterval,
+                    metadata=self.avro_metadata,
+                    validator=self.avro_validator,
+                    sync_marker=self.avro_syncmarker,
+                    compression_level=self.avro_compressionlevel,
+                    threads=self.avro_compressionthreads,
+                )
+            else:
+                self.avro_writer = fa_Writer(
+                    self.file,
+                    self.avro_parsedschema,
+                    codec=self.avro_compression,
+                    sync_interval=self.avro_syncinterval,
+                    metadata=self.avro_metadata,
+                    validator=self.avro_validator,
+                    sync_marker=self.avro_syncmarker,
+                    compression_level=self.avro_compressionlevel,
+                )
+        return self.avro_writer
 
     def _get_dict_from_item(self, item):
         """
@@ -405,8 +1114,7 @@ class AvroItemExporter(BaseItemExporter):
             self._get_serialized_fields(item, default_value="", include_empty=True)
         )
         if self.avro_convertstr:
-            for column in fields:
-                fields[column] = str(fields.column)
+            fields = {column: str(value) for column, value in fields.items()}
         return fields
 
 
@@ -447,6 +1155,12 @@ class OrcItemExporter(BaseItemExporter):
         ## exporter
         self.orc_convertstr = options.pop("convertallstrings", False)
         self.orc_no_items_batch = options.pop("no_items_batch", 10000)
+        self.orc_max_buffer_bytes = options.pop("max_buffer_bytes", None)
+        self.orc_schema_inference_items = options.pop("schema_inference_items", 10000)
+        self.orc_dictionary_columns = options.pop("dictionary_columns", None)
+        self.orc_dictionary_max_cardinality = options.pop(
+            "dictionary_max_cardinality", 0.1
+        )
         ## orc
         self.orc_file_version = options.pop("file_version", "0.12")
         self.orc_batch_size = options.pop("batch_size", 1024)
@@ -474,13 +1188,22 @@ class OrcItemExporter(BaseItemExporter):
         if len(self.columns) == 0:
             self._init_table(item)
         # Create a new row group to write
-        if self.itemcount > self.orc_no_items_batch:
+        if self.itemcount > self.orc_no_items_batch and not self.batch.schema_pending:
+            self._flush_table()
+        # Add the item to the column buffers
+        if isinstance(item, ArrowBulkItem):
+            self.batch.append_bulk(item.data)
+            self.itemcount += len(item)
+        else:
+            self._append_item(item)
+            self.itemcount += 1
+        # Flush if the buffer exceeds the memory budget
+        if (
+            self.orc_max_buffer_bytes is not None
+            and self.batch.nbytes >= self.orc_max_buffer_bytes
+            and not self.batch.schema_pending
+        ):
             self._flush_table()
-        # Add the item to data frame
-        self.df = pd.concat(
-            [self.df if not self.df.empty else None, self._get_df_from_item(item)]
-        )
-        self.itemcount += 1
         return item
 
     def start_exporting(self):
@@ -507,17 +1230,11 @@ class OrcItemExporter(BaseItemExporter):
         """
         Writes the current record cache to avro file
         """
-        if len(self.df.index) > 0:
+        if self.itemcount > 0:
             # reset written entries
             self.itemcount = 0
-            # write existing dataframe as orc file
-            if self.orc_schema is not None:
-                table = pyarrow.Table.from_pandas(
-                    self.df, schema=self.orc_schema, safe=orc_pyarrow_safe_schema
-                )
-            else:
-                table = pyarrow.Table.from_pandas(self.df)
-            table = pyarrow.Table.from_pandas(self.df)
+            # convert column buffers to table. Orc does not support dictionary types
+            table = decode_dictionaries(self.batch.to_table())
             if self.orc_writer is None:
                 self.orc_writer = pyarrow.orc.ORCWriter(
                     self.file.name,
@@ -535,14 +1252,17 @@ class OrcItemExporter(BaseItemExporter):
                 )
             # write cache to orc file
             self.orc_writer.write(table)
-            # initialize new data frame
-            self._reset_dataframe()
+            # initialize new column buffers
+            self.batch.reset()
 
     def _get_columns(self, item):
         """
         Determines the columns of an item
         """
-        if isinstance(item, dict):
+        if isinstance(item, ArrowBulkItem):
+            # use columns of the bulk item
+            self.columns = item.columns
+        elif isinstance(item, dict):
             # for dicts try using fields of the first item
             self.columns = list(item.keys())
         else:
@@ -551,40 +1271,253 @@ class OrcItemExporter(BaseItemExporter):
 
     def _init_table(self, item):
         """
-        Initializes table for parquet file
+        Initializes table for orc file
         """
         # initialize columns
         self._get_columns(item)
-        self._reset_dataframe()
+        # use the types declared in the item fields and infer the others once from the first items
+        item_fields = get_item_fields(item, self.columns)
+        schema_inference = None
+        if (
+            self.orc_schema_inference_items is not None
+            or len(item_fields) > 0
+            or self.orc_dictionary_columns is not None
+        ):
+            schema_inference = ArrowSchemaInference(
+                self.orc_schema_inference_items,
+                item_fields,
+                self.orc_dictionary_columns,
+                self.orc_dictionary_max_cardinality,
+            )
+        self.extractor = ItemFieldExtractor(self, self.columns)
+        self.batch = ArrowBatchBuilder(
+            self.columns,
+            schema=self.orc_schema,
+            safe=self.orc_pyarrow_safe_schema,
+            convertallstrings=self.orc_convertstr,
+            estimate_nbytes=self.orc_max_buffer_bytes is not None,
+            schema_inference=schema_inference,
+        )
 
-    def _get_df_from_item(self, item):
+    def _append_item(self, item):
         """
-        Get the dataframe from item
+        Append the values of an item to the column buffers
         """
-        row = {}
-        fields = dict(
-            self._get_serialized_fields(item, default_value="", include_empty=True)
+        self.batch.append_values(self.extractor.extract(item))
+
+
+"""
+Arrow IPC exporter
+Write export as Arrow IPC stream or file (Feather V2)
+"""
+
+
+class ArrowIpcItemExporter(BaseItemExporter):
+    """
+    Arrow IPC exporter
+    """
+
+    def __init__(self, file, dont_fail=False, **kwargs):
+        """
+        Initialize exporter
+        """
+        super().__init__(**kwargs)
+        self.file = file  # file name
+        self.itemcount = 0  # initial item count
+        self.columns = []  # columns to export
+        self.logger = logging.getLogger()
+        if SUPPORTED_EXPORTERS["arrow"]:
+            self._configure(kwargs, dont_fail=dont_fail)
+
+    def _configure(self, options, dont_fail=False):
+        """Configure the exporter by poping options from the ``options`` dict.
+        If dont_fail is set, it won't raise an exception on unexpected options
+        (useful for using with keyword arguments in subclasses ``__init__`` methods)
+        """
+        self.encoding = options.pop("encoding", None)
+        self.fields_to_export = options.pop("fields_to_export", None)
+        self.export_empty_fields = options.pop("export_empty_fields", False)
+        # Read settings
+        self.ipc_pyarrow_safe_schema = options.pop("pyarrow_safe_schema", True)
+        self.ipc_schema = options.pop("schema", None)
+        ## exporter
+        self.ipc_convertstr = options.pop("convertallstrings", False)
+        self.ipc_no_items_batch = options.pop("no_items_batch", 10000)
+        self.ipc_max_buffer_bytes = options.pop("max_buffer_bytes", None)
+        self.ipc_schema_inference_items = options.pop("schema_inference_items", 10000)
+        self.ipc_dictionary_columns = options.pop("dictionary_columns", None)
+        self.ipc_dictionary_max_cardinality = options.pop(
+            "dictionary_max_cardinality", 0.1
         )
-        for column in self.columns:
-            if self.orc_convertstr == True:
-                row[column] = str(fields.get(column, None))
-            else:
-                value = fields.get(column, None)
-                row[column] = value
-        if self.orc_convertstr == True:
-            return pd.DataFrame(row, index=[0]).astype(str)
-        return pd.DataFrame.from_dict([row])
+        ## arrow ipc
+        self.ipc_format = options.pop("format", "stream")
+        self.ipc_compression = options.pop("compression", None)
+        self.ipc_compression_level = options.pop("compression_level", None)
+        self.ipc_use_threads = options.pop("use_threads", True)
+        self.ipc_emit_dictionary_deltas = options.pop("emit_dictionary_deltas", False)
+        # Validate settings
+        if self.ipc_format not in ("stream", "file"):
+            raise RuntimeError(
+                f"Error: Unknown Arrow IPC format {self.ipc_format}. Supported formats are stream and file"
+            )
+        if self.ipc_compression not in (None, "lz4", "zstd"):
+            raise RuntimeError(
+                f"Error: Unknown Arrow IPC compression {self.ipc_compression}. Supported compressions are lz4 and zstd"
+            )
+        # Init writer
+        self.ipc_writer = None
+        self.ipc_writer_schema = None
+
+    def export_item(self, item):
+        """
+        Export a specific item to the file
+        """
+        # Initialize writer
+        if len(self.columns) == 0:
+            self._init_table(item)
+        # Create a new record batch to write
+        if self.itemcount > self.ipc_no_items_batch and not self.batch.schema_pending:
+            self._flush_table()
+        # Add the item to the column buffers
+        if isinstance(item, ArrowBulkItem):
+            self.batch.append_bulk(item.data)
+            self.itemcount += len(item)
+        else:
+            self._append_item(item)
+            self.itemcount += 1
+        # Flush if the buffer exceeds the memory budget
+        if (
+            self.ipc_max_buffer_bytes is not None
+            and self.batch.nbytes >= self.ipc_max_buffer_bytes
+            and not self.batch.schema_pending
+        ):
+            self._flush_table()
+        return item
+
+    def start_exporting(self):
+        """
+        Triggered when Scrapy starts exporting. Useful to configure headers etc.
+        """
+        if not SUPPORTED_EXPORTERS["arrow"]:
+            raise RuntimeError(
+                "Error: Cannot export to arrow. Cannot import pyarrow.ipc. Have you installed it?"
+            )
+
+    def finish_exporting(self):
+        """
+        Triggered when Scrapy ends exporting. Useful to shutdown threads, close files etc.
+        """
+        # flush last items from column buffers
+        self._flush_table()
+        # write end of stream or footer of the file
+        if self.ipc_writer is not None:
+            self.ipc_writer.close()
+            self.ipc_writer = None
+        self.file.flush()
+
+    def _flush_table(self):
+        """
+        Writes the current column buffers as record batches to the Arrow IPC stream or file
+        """
+        if self.itemcount > 0:
+            # reset written entries
+            self.itemcount = 0
+            for batch in self.batch.to_record_batches():
+                self._write_record_batch(batch)
+            # readers of the stream can read the record batches now
+            self.file.flush()
+            # initialize new column buffers
+            self.batch.reset()
+
+    def _write_record_batch(self, batch):
+        """
+        Writes a record batch to the Arrow IPC stream or file
+        """
+        if self.ipc_format == "file":
+            # the file format does not support different dictionaries per record batch
+            batch = decode_dictionaries(batch)
+        if self.ipc_writer is None:
+            self.ipc_writer_schema = batch.schema
+            self.ipc_writer = self._new_writer(batch.schema)
+        elif not batch.schema.equals(self.ipc_writer_schema):
+            # the schema of batches can differ only if it is not inferred once
+            try:
+                batch = batch.cast(
+                    self.ipc_writer_schema, safe=self.ipc_pyarrow_safe_schema
+                )
+            except (pyarrow.ArrowInvalid, pyarrow.ArrowNotImplementedError) as e:
+                raise RuntimeError(
+                    "Error: Record batch does not match the schema of the Arrow IPC stream or file. Specify a schema or set schema_inference_items"
+                ) from e
+        self.ipc_writer.write_batch(batch)
+
+    def _new_writer(self, schema):
+        """
+        Creates the Arrow IPC stream or file writer
+        """
+        compression = self.ipc_compression
+        if compression is not None and self.ipc_compression_level is not None:
+            compression = pyarrow.Codec(
+                compression, compression_level=self.ipc_compression_level
+            )
+        options = pyarrow.ipc.IpcWriteOptions(
+            compression=compression,
+            use_threads=self.ipc_use_threads,
+            emit_dictionary_deltas=self.ipc_emit_dictionary_deltas,
+        )
+        if self.ipc_format == "file":
+            return pyarrow.ipc.new_file(self.file, schema, options=options)
+        return pyarrow.ipc.new_stream(self.file, schema, options=options)
 
-    def _reset_dataframe(self):
+    def _get_columns(self, item):
         """
-        Reset dataframe for writing
+        Determines the columns of an item
         """
-        if self.orc_convertstr == False:  # auto determine schema
-            # initialize df
-            self.df = pd.DataFrame(columns=self.columns)
+        if isinstance(item, ArrowBulkItem):
+            # use columns of the bulk item
+            self.columns = item.columns
+        elif isinstance(item, dict):
+            # for dicts try using fields of the first item
+            self.columns = list(item.keys())
         else:
-            # initialize df with zero strings to derive correct schema
-            self.df = pd.DataFrame(columns=self.columns).astype(str)
+            # use fields declared in Item
+            self.columns = list(item.fields.keys())
+
+    def _init_table(self, item):
+        """
+        Initializes table for Arrow IPC stream or file
+        """
+        # initialize columns
+        self._get_columns(item)
+        # use the types declared in the item fields and infer the others once from the first items
+        item_fields = get_item_fields(item, self.columns)
+        schema_inference = None
+        if (
+            self.ipc_schema_inference_items is not None
+            or len(item_fields) > 0
+            or self.ipc_dictionary_columns is not None
+        ):
+            schema_inference = ArrowSchemaInference(
+                self.ipc_schema_inference_items,
+                item_fields,
+                self.ipc_dictionary_columns,
+                self.ipc_dictionary_max_cardinality,
+            )
+        self.extractor = ItemFieldExtractor(self, self.columns)
+        self.batch = ArrowBatchBuilder(
+            self.columns,
+            schema=self.ipc_schema,
+            safe=self.ipc_pyarrow_safe_schema,
+            convertallstrings=self.ipc_convertstr,
+            estimate_nbytes=self.ipc_max_buffer_bytes is not None,
+            schema_inference=schema_inference,
+        )
+
+    def _append_item(self, item):
+        """
+        Append the values of an item to the column buffers
+        """
+        self.batch.append_values(self.extractor.extract(item))
 
 
 """
@@ -593,6 +1526,179 @@ Write export as open table format Iceberg
 """
 
 
+class IcebergCatalogCache:
+    """
+    Process-wide cache of Iceberg catalogs and tables shared by all IcebergItemExporter instances
+    """
+
+    def __init__(self):
+        """
+        Initialize cache
+        """
+        self.catalogs = {}  # catalogs by configuration
+        self.namespaces = set()  # namespaces created by configuration
+        self.tables = {}  # loaded tables by configuration and table name
+        self.lock = threading.Lock()
+
+    def get_catalog(self, configuration):
+        """
+        Returns the catalog for a configuration (name, properties). The catalog is only loaded if it is not in the cache.
+        If configuration is None then the catalog is configured outside (e.g. using environment variables)
+        """
+        key = self._get_key(configuration)
+        with self.lock:
+            catalog = self.catalogs.get(key)
+            if catalog is None:
+                if configuration is None:
+                    catalog = load_catalog()
+                else:
+                    catalog = load_catalog(configuration[0], **configuration[1])
+                self.catalogs[key] = catalog
+            return catalog
+
+    def create_namespace_if_not_exists(self, configuration, namespace, properties):
+        """
+        Creates a namespace in the catalog if it has not been created before by this process
+        """
+        key = (self._get_key(configuration), namespace)
+        with self.lock:
+            if key in self.namespaces:
+                return
+        self.get_catalog(configuration).create_namespace_if_not_exists(
+            namespace, properties
+        )
+        with self.lock:
+            self.namespaces.add(key)
+
+    def get_table(self, configuration, name):
+        """
+        Returns a loaded table or None if it is not in the cache
+        """
+        with self.lock:
+            return self.tables.get((self._get_key(configuration), name))
+
+    def set_table(self, configuration, name, table):
+        """
+        Stores a loaded table in the cache
+        """
+        with self.lock:
+            self.tables[(self._get_key(configuration), name)] = table
+
+    def remove_table(self, configuration, name):
+        """
+        Removes a table from the cache, e.g. if it has been dropped or recreated by another process
+        """
+        with self.lock:
+            self.tables.pop((self._get_key(configuration), name), None)
+
+    def clear(self):
+        """
+        Removes all catalogs, namespaces and tables from the cache
+        """
+        with self.lock:
+            self.catalogs.clear()
+            self.namespaces.clear()
+            self.tables.clear()
+
+    def _get_key(self, configuration):
+        """
+        Returns the canonical JSON representation of the catalog configuration
+        """
+        return json.dumps(configuration, sort_keys=True, default=str)
+
+
+ICEBERG_CATALOG_CACHE = IcebergCatalogCache()
+
+
+def compact_iceberg_table(
+    table, snapshot_ids=None, target_file_size_bytes=None, expire_snapshots=False
+):
+    """
+    Rewrites the data files of an Iceberg table that are smaller than the target file size into files of the target size in one commit.
+    If snapshot_ids are specified then only the data files added by these snapshots (e.g. the snapshots of one crawl) are rewritten and, if expire_snapshots is True, these snapshots are expired afterwards.
+    Returns the number of data files that have been rewritten
+    """
+    properties = dict(table.metadata.properties)
+    if target_file_size_bytes is not None:
+        properties["write.target-file-size-bytes"] = str(target_file_size_bytes)
+    target_file_size_bytes = int(
+        properties.get("write.target-file-size-bytes", 536870912)
+    )
+    snapshot = table.current_snapshot()
+    if snapshot is None:
+        return 0
+    manifests = snapshot.manifests(table.io)
+    if any(manifest.content != ManifestContent.DATA for manifest in manifests):
+        # rows of delete files would need to be applied when rewriting
+        logging.getLogger().warning(
+            f"Iceberg: Table {table.name()} has delete files. Skipping compaction"
+        )
+        return 0
+    data_files = [
+        entry.data_file
+        for manifest in manifests
+        for entry in manifest.fetch_manifest_entry(table.io, discard_deleted=True)
+        if (snapshot_ids is None or entry.snapshot_id in snapshot_ids)
+        and entry.data_file.file_size_in_bytes < target_file_size_bytes
+    ]
+    # rewrite only groups of at least two data files, each group is read into memory separately
+    groups = [
+        group
+        for group in _pack_data_files(data_files, target_file_size_bytes)
+        if len(group) > 1
+    ]
+    data_files = [data_file for group in groups for data_file in group]
+    if len(groups) > 0:
+        table_metadata = table.metadata.model_copy(update={"properties": properties})
+        compacted_data_files = []
+        for group in groups:
+            arrow_table = ArrowScan(
+                table.metadata, table.io, table.schema(), AlwaysTrue()
+            ).to_table([FileScanTask(data_file) for data_file in group])
+            compacted_data_files.extend(
+                _dataframe_to_data_files(
+                    table_metadata=table_metadata, df=arrow_table, io=table.io
+                )
+            )
+            del arrow_table
+        with table.transaction() as transaction:
+            with transaction.update_snapshot().overwrite() as rewrite_files:
+                for data_file in data_files:
+                    rewrite_files.delete_data_file(data_file)
+                for data_file in compacted_data_files:
+                    rewrite_files.append_data_file(data_file)
+    if expire_snapshots and snapshot_ids is not None:
+        expired_snapshot_ids = [
+            snapshot_id
+            for snapshot_id in snapshot_ids
+            if snapshot_id != table.current_snapshot().snapshot_id
+            and table.snapshot_by_id(snapshot_id) is not None
+        ]
+        if len(expired_snapshot_ids) > 0:
+            table.maintenance.expire_snapshots().by_ids(expired_snapshot_ids).commit()
+    return len(data_files)
+
+
+def _pack_data_files(data_files, target_file_size_bytes):
+    """
+    Groups data files of the same partition so that the total size of each group is at most the target file size (bin packing)
+    """
+    groups = []
+    open_groups = {}  # group currently filled and its size by partition
+    for data_file in data_files:
+        key = (data_file.spec_id, repr(data_file.partition))
+        group, size = open_groups.get(key, (None, 0))
+        if (
+            group is None
+            or size + data_file.file_size_in_bytes > target_file_size_bytes
+        ):
+            group, size = [], 0
+            groups.append(group)
+        group.append(data_file)
+        open_groups[key] = (group, size + data_file.file_size_in_bytes)
+    return groups
+
+
 class IcebergItemExporter(BaseItemExporter):
     """
     Iceberg exporter
@@ -623,6 +1729,24 @@ class IcebergItemExporter(BaseItemExporter):
         # Read settings
         self.convertstr = options.pop("convertallstrings", False)
         self.no_items_batch = options.pop("no_items_batch", 10000)
+        self.max_buffer_bytes = options.pop("max_buffer_bytes", None)
+        self.schema_inference_items = options.pop("schema_inference_items", 10000)
+        self.dictionary_columns = options.pop("dictionary_columns", None)
+        self.dictionary_max_cardinality = options.pop("dictionary_max_cardinality", 0.1)
+        self.commit_interval = options.pop("commit_interval", None)
+        # if only commit_interval is given, then commit based on time only
+        self.commit_batches = options.pop(
+            "commit_batches", 1 if self.commit_interval is None else None
+        )
+        self.commit_retries = options.pop("commit_retries", 3)
+        self.write_mode = options.pop("write_mode", "append")
+        self.parquet_options = options.pop("parquet_options", {})
+        self.target_file_size_bytes = options.pop("target_file_size_bytes", 536870912)
+        self.compact = options.pop("compact", False)
+        self.compact_target_file_size_bytes = options.pop(
+            "compact_target_file_size_bytes", None
+        )
+        self.compact_expire_snapshots = options.pop("compact_expire_snapshots", False)
         self.iceberg_catalog = options.pop("iceberg_catalog", {})
         self.iceberg_namespace = options.pop("iceberg_namespace", {})
         self.iceberg_table = options.pop("iceberg_table", {})
@@ -631,6 +1755,23 @@ class IcebergItemExporter(BaseItemExporter):
             raise RuntimeError(
                 "Iceberg: Number of items in batch processing cannot be smaller than 1"
             )
+        if self.commit_batches is not None and self.commit_batches < 1:
+            raise RuntimeError(
+                "Iceberg: Number of batches per commit cannot be smaller than 1"
+            )
+        if self.commit_batches is None and self.commit_interval is None:
+            raise RuntimeError(
+                "Iceberg: Either commit_batches or commit_interval must be specified"
+            )
+        if self.write_mode not in ("append", "add_files"):
+            raise RuntimeError(
+                f'Iceberg: Invalid write mode "{self.write_mode}" specified. Supported are "append" and "add_files"'
+            )
+        if self.write_mode == "add_files":
+            # reuse the writer options of the Parquet exporter for the data files
+            self.parquet_exporter = ParquetItemExporter(
+                file=None, **dict(self.parquet_options)
+            )
         # An iceberg configuration is complex and is not processed as this time. Thus, we do only a simple validation.
         if len(self.iceberg_catalog) == 0:
             logging.getLogger().warn(
@@ -673,6 +1814,34 @@ class IcebergItemExporter(BaseItemExporter):
         )
         self.iceberg_table_location = self.iceberg_table.get("location", None)
         self.iceberg_table_properties = self.iceberg_table.get("properties", {})
+        self.iceberg_table_partition_spec = [
+            self._parse_partition_field(partition_field)
+            for partition_field in self.iceberg_table.get("partition_spec", [])
+        ]
+        if (
+            self.write_mode == "add_files"
+            and len(self.iceberg_table_partition_spec) > 0
+        ):
+            raise RuntimeError(
+                'Iceberg: Write mode "add_files" does not support a partition spec'
+            )
+
+    def _parse_partition_field(self, partition_field):
+        """
+        Parses a partition field, e.g. day(crawl_ts), identity(domain) or bucket(16, url), into the source column and the Iceberg transform
+        """
+        match = re.fullmatch(
+            r"\s*(\w+)\s*\(\s*(?:(\d+)\s*,\s*)?(\w+)\s*\)\s*", partition_field
+        )
+        if match is None:
+            raise RuntimeError(
+                f'Iceberg: Invalid partition field "{partition_field}" in "iceberg_table" specified'
+            )
+        transform, parameter, source_column = match.groups()
+        if parameter is not None:
+            # e.g. bucket[16] or truncate[10]
+            transform = f"{transform}[{parameter}]"
+        return source_column, transform
 
     def export_item(self, item):
         """
@@ -682,13 +1851,22 @@ class IcebergItemExporter(BaseItemExporter):
         if len(self.columns) == 0:
             self._init_table(item)
         # Create a new row group to write
-        if self.itemcount > self.no_items_batch:
+        if self.itemcount > self.no_items_batch and not self.batch.schema_pending:
+            self._flush_table()
+        # Add the item to the column buffers
+        if isinstance(item, ArrowBulkItem):
+            self.batch.append_bulk(item.data)
+            self.itemcount += len(item)
+        else:
+            self._append_item(item)
+            self.itemcount += 1
+        # Flush if the buffer exceeds the memory budget
+        if (
+            self.max_buffer_bytes is not None
+            and self.batch.nbytes >= self.max_buffer_bytes
+            and not self.batch.schema_pending
+        ):
             self._flush_table()
-        # Add the item to data frame
-        self.df = pd.concat(
-            [self.df if not self.df.empty else None, self._get_df_from_item(item)]
-        )
-        self.itemcount += 1
         return item
 
     def start_exporting(self):
@@ -700,20 +1878,30 @@ class IcebergItemExporter(BaseItemExporter):
                 "Error: Cannot export to iceberg. Cannot import pyiceberg. Have you installed it?"
             )
         # Initialize catalog
-        if self.iceberg_catalog_configuration == None:
-            self.pyiceberg_catalog = load_catalog()
-        else:
-            self.pyiceberg_catalog = load_catalog(
-                self.iceberg_catalog_configuration[0],
-                **self.iceberg_catalog_configuration[1],
-            )
+        self.pyiceberg_catalog = ICEBERG_CATALOG_CACHE.get_catalog(
+            self.iceberg_catalog_configuration
+        )
         # Initialize namespace
         if self.iceberg_namespace_create_if_not_exists:
-            self.pyiceberg_catalog.create_namespace_if_not_exists(
-                self.iceberg_namespace_name, self.iceberg_namespace_properties
+            ICEBERG_CATALOG_CACHE.create_namespace_if_not_exists(
+                self.iceberg_catalog_configuration,
+                self.iceberg_namespace_name,
+                self.iceberg_namespace_properties,
             )
         # Initialize table
         self.pyiceberg_table = None
+        # Initialize data files written, but not yet committed
+        self.pending_data_files = []
+        self.pending_batches = 0
+        self.last_commit_time = time.monotonic()
+        self.write_uuid = uuid.uuid4()
+        self.write_counter = itertools.count(0)
+        # Initialize Parquet data file written in write mode add_files
+        self.data_file_writer = None
+        self.data_file_stream = None
+        self.data_file_paths = []
+        # Initialize snapshots committed by this exporter
+        self.snapshot_ids = []
 
     def finish_exporting(self):
         """
@@ -721,6 +1909,10 @@ class IcebergItemExporter(BaseItemExporter):
         """
         # write possible remaining data
         self._flush_table()
+        self._commit_data_files()
+        self._add_data_files()
+        if self.compact:
+            self._compact()
         # write json with number of items scraped
         self.file.write(
             bytearray(json.dumps({"noitems": self.totalitemcount}), "utf-8")
@@ -732,7 +1924,10 @@ class IcebergItemExporter(BaseItemExporter):
         """
         Determines the columns of an item
         """
-        if isinstance(item, dict):
+        if isinstance(item, ArrowBulkItem):
+            # use columns of the bulk item
+            self.columns = item.columns
+        elif isinstance(item, dict):
             # for dicts try using fields of the first item
             self.columns = list(item.keys())
         else:
@@ -745,69 +1940,257 @@ class IcebergItemExporter(BaseItemExporter):
         """
         # initialize columns
         self._get_columns(item)
-        self._reset_rowgroup()
-
-    def _get_df_from_item(self, item):
-        """
-        Get the dataframe from item
-        """
-        row = {}
-        fields = dict(
-            self._get_serialized_fields(item, default_value="", include_empty=True)
+        # use the types declared in the item fields and infer the others once from the first items
+        item_fields = get_item_fields(item, self.columns)
+        schema_inference = None
+        if (
+            self.schema_inference_items is not None
+            or len(item_fields) > 0
+            or self.dictionary_columns is not None
+        ):
+            schema_inference = ArrowSchemaInference(
+                self.schema_inference_items,
+                item_fields,
+                self.dictionary_columns,
+                self.dictionary_max_cardinality,
+            )
+        self.extractor = ItemFieldExtractor(self, self.columns)
+        self.batch = ArrowBatchBuilder(
+            self.columns,
+            schema=self.schema,
+            safe=self.pyarrow_safe_schema,
+            convertallstrings=self.convertstr,
+            estimate_nbytes=self.max_buffer_bytes is not None,
+            schema_inference=schema_inference,
         )
-        for column in self.columns:
-            if self.convertstr == True:
-                row[column] = str(fields.get(column, None))
-            else:
-                value = fields.get(column, None)
-                row[column] = value
-        if self.convertstr == True:
-            return pd.DataFrame(row, index=[0]).astype(str)
-        return pd.DataFrame.from_dict([row])
 
-    def _reset_rowgroup(self):
+    def _append_item(self, item):
         """
-        Reset dataframe for writing
+        Append the values of an item to the column buffers
         """
-        if self.convertstr == False:  # auto determine schema
-            # initialize df
-            self.df = pd.DataFrame(columns=self.columns)
-        else:
-            # initialize df with zero strings to derive correct schema
-            self.df = pd.DataFrame(columns=self.columns).astype(str)
+        self.batch.append_values(self.extractor.extract(item))
 
     def _flush_table(self):
         """
         Append current batch to Iceberg table
         """
-        if len(self.df.index) > 0:
+        if self.itemcount > 0:
             # reset written entries
             self.totalitemcount += self.itemcount
             self.itemcount = 0
             # Convert to arrow
-            if self.schema is not None:
-                table = pyarrow.Table.from_pandas(
-                    self.df, schema=self.schema, safe=pyarrow_safe_schema
+            arrow_table = self.batch.to_table()
+            # check if table is loaded. Iceberg does not have dictionary types
+            if self.pyiceberg_table is None:
+                self._load_table(decode_dictionary_schema(arrow_table.schema))
+            if self.write_mode == "add_files":
+                # write data to Parquet data files that are added to the table when finishing
+                self._write_parquet_data_file(arrow_table)
+            elif self.commit_batches == 1 and self.commit_interval is None:
+                # append data
+                self._commit(
+                    lambda table: table.append(decode_dictionaries(arrow_table))
                 )
             else:
-                table = pyarrow.Table.from_pandas(self.df)
-            arrow_table = pyarrow.Table.from_pandas(self.df)
-            # check if table is loaded
-            if self.pyiceberg_table is None:
-                if self.iceberg_table_create_if_not_exists:
-                    self.pyiceberg_table = (
-                        self.pyiceberg_catalog.create_table_if_not_exists(
-                            self.iceberg_table_name,
-                            schema=arrow_table.schema,
-                            location=self.iceberg_table_location,
-                            properties=self.iceberg_table_properties,
-                        )
+                # write data files now and commit them together with later batches
+                self.pending_data_files.extend(
+                    _dataframe_to_data_files(
+                        table_metadata=self.pyiceberg_table.metadata,
+                        df=decode_dictionaries(arrow_table),
+                        io=self.pyiceberg_table.io,
+                        write_uuid=self.write_uuid,
+                        counter=self.write_counter,
                     )
-                else:
-                    self.iceberg_table_properties = self.pyiceberg_catalog.load_table(
-                        self.iceberg_table_name
+                )
+                self.pending_batches += 1
+                if (
+                    self.commit_batches is not None
+                    and self.pending_batches >= self.commit_batches
+                ) or (
+                    self.commit_interval is not None
+                    and time.monotonic() - self.last_commit_time >= self.commit_interval
+                ):
+                    self._commit_data_files()
+            # initialize new column buffers for new batch
+            self.batch.reset()
+
+    def _commit_data_files(self):
+        """
+        Commits all written data files in one snapshot to the Iceberg table
+        """
+        if len(self.pending_data_files) > 0:
+            self._commit(self._append_data_files)
+            self.pending_data_files = []
+        self.pending_batches = 0
+        self.last_commit_time = time.monotonic()
+
+    def _write_parquet_data_file(self, arrow_table):
+        """
+        Writes a batch to the current Parquet data file in the table location. A new data file is started if the target file size is reached
+        """
+        if self.data_file_writer is None:
+            path = self.pyiceberg_table.location_provider().new_data_location(
+                f"{self.write_uuid}-{next(self.write_counter)}.parquet"
+            )
+            self.data_file_stream = self.pyiceberg_table.io.new_output(path).create(
+                overwrite=True
+            )
+            self.data_file_writer = self.parquet_exporter._new_writer(
+                self.data_file_stream, arrow_table.schema
+            )
+            self.data_file_paths.append(path)
+        self.data_file_writer.write_table(
+            self.parquet_exporter._sort_batch(arrow_table),
+            self.parquet_exporter.pq_row_group_size,
+        )
+        if self.data_file_stream.tell() >= self.target_file_size_bytes:
+            self._close_parquet_data_file()
+
+    def _close_parquet_data_file(self):
+        """
+        Closes the current Parquet data file
+        """
+        if self.data_file_writer is not None:
+            self.data_file_writer.close()
+            self.data_file_stream.close()
+            self.data_file_writer = None
+            self.data_file_stream = None
+
+    def _add_data_files(self):
+        """
+        Adds all written Parquet data files in one snapshot to the Iceberg table
+        """
+        self._close_parquet_data_file()
+        if len(self.data_file_paths) > 0:
+            self._commit(lambda table: table.add_files(self.data_file_paths))
+            self.data_file_paths = []
+
+    def _append_data_files(self, table):
+        """
+        Appends the pending data files to the table in one snapshot
+        """
+        with table.transaction() as transaction:
+            with transaction.update_snapshot().fast_append() as append_files:
+                for data_file in self.pending_data_files:
+                    append_files.append_data_file(data_file)
+
+    def _compact(self):
+        """
+        Rewrites the small data files added by this export into files of the target size
+        """
+        if len(self.snapshot_ids) > 0:
+            snapshot_ids = list(self.snapshot_ids)
+            self._commit(
+                lambda table: compact_iceberg_table(
+                    table,
+                    snapshot_ids=snapshot_ids,
+                    target_file_size_bytes=self.compact_target_file_size_bytes,
+                    expire_snapshots=self.compact_expire_snapshots,
+                )
+            )
+
+    def _commit(self, commit):
+        """
+        Runs a commit on the table. If the table has been changed concurrently then the table is refreshed and the commit is retried.
+        If the table has been dropped or its schema does not match (e.g. it has been recreated by another process) then the table is reloaded once and the commit is retried
+        """
+        reloaded = False
+        retry = 0
+        while True:
+            try:
+                commit(self.pyiceberg_table)
+                self.snapshot_ids.append(
+                    self.pyiceberg_table.current_snapshot().snapshot_id
+                )
+                return
+            except CommitFailedException:
+                if retry == self.commit_retries:
+                    raise
+                retry += 1
+                self.logger.info(
+                    f"Iceberg: Concurrent commit to table {self.iceberg_table_name}. Refreshing table and retrying"
+                )
+                try:
+                    self.pyiceberg_table.refresh()
+                except NoSuchTableError:
+                    self._reload_table()
+                    reloaded = True
+            except (NoSuchTableError, ValueError):
+                # the cached table is stale
+                if reloaded:
+                    raise
+                self.logger.info(
+                    f"Iceberg: Table {self.iceberg_table_name} has been dropped or its schema has changed. Reloading table and retrying"
+                )
+                self._reload_table()
+                reloaded = True
+
+    def _reload_table(self):
+        """
+        Removes the table from the process-wide cache and loads it again from the catalog
+        """
+        ICEBERG_CATALOG_CACHE.remove_table(
+            self.iceberg_catalog_configuration, self.iceberg_table_name
+        )
+        self._load_table(self.table_schema)
+
+    def _load_table(self, schema):
+        """
+        Loads the table from the process-wide cache or from the catalog
+        """
+        # schema used to create the table if it needs to be reloaded
+        self.table_schema = schema
+        self.pyiceberg_table = ICEBERG_CATALOG_CACHE.get_table(
+            self.iceberg_catalog_configuration, self.iceberg_table_name
+        )
+        if self.pyiceberg_table is None:
+            if (
+                self.iceberg_table_create_if_not_exists
+                and len(self.iceberg_table_partition_spec) > 0
+            ):
+                self._create_partitioned_table_if_not_exists(schema)
+            elif self.iceberg_table_create_if_not_exists:
+                self.pyiceberg_table = (
+                    self.pyiceberg_catalog.create_table_if_not_exists(
+                        self.iceberg_table_name,
+                        schema=schema,
+                        location=self.iceberg_table_location,
+                        properties=self.iceberg_table_properties,
                     )
-            # append data
-            self.pyiceberg_table.append(arrow_table)
-            # initialize new data frame for new row group
-            self._reset_rowgroup()
+                )
+            else:
+                self.pyiceberg_table = self.pyiceberg_catalog.load_table(
+                    self.iceberg_table_name
+                )
+            ICEBERG_CATALOG_CACHE.set_table(
+                self.iceberg_catalog_configuration,
+                self.iceberg_table_name,
+                self.pyiceberg_table,
+            )
+        if (
+            self.write_mode == "add_files"
+            and not self.pyiceberg_table.spec().is_unpartitioned()
+        ):
+            raise RuntimeError(
+                f'Iceberg: Write mode "add_files" does not support partitioned table {self.iceberg_table_name}'
+            )
+
+    def _create_partitioned_table_if_not_exists(self, schema):
+        """
+        Creates the table with the configured partition spec or loads it if it exists
+        """
+        try:
+            transaction = self.pyiceberg_catalog.create_table_transaction(
+                self.iceberg_table_name,
+                schema=schema,
+                location=self.iceberg_table_location,
+                properties=self.iceberg_table_properties,
+            )
+            with transaction.update_spec() as update_spec:
+                for source_column, transform in self.iceberg_table_partition_spec:
+                    update_spec.add_field(source_column, parse_transform(transform))
+            self.pyiceberg_table = transaction.commit_transaction()
+        except TableAlreadyExistsError:
+            self.pyiceberg_table = self.pyiceberg_catalog.load_table(
+                self.iceberg_table_name
+            )